@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from attrs import asdict, frozen
+
+from advent.generate import generate
+from advent.runner import load, parse_days, read_input
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import ModuleType
+
+PHASES = ("parse", "part_one", "part_two")
+
+# Slowdowns smaller than this many seconds are treated as noise.
+NOISE_FLOOR = 0.001
+
+
+@frozen
+class Stats:
+    min: float
+    median: float
+    p95: float
+    # Bytes, as reported by tracemalloc.
+    peak_memory: int
+
+    @staticmethod
+    def from_timings(timings: list[float], peak_memory: int) -> Stats:
+        ordered = sorted(timings)
+        rank = math.ceil(0.95 * len(ordered)) - 1
+        return Stats(ordered[0], statistics.median(ordered), ordered[rank], peak_memory)
+
+
+def measure(function: Callable[[Any], Any], arg: Any, repeat: int) -> Stats:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(arg)
+        timings.append(time.perf_counter() - start)
+
+    # Tracing slows everything down, so measure memory on a separate run.
+    tracemalloc.start()
+    try:
+        function(arg)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Stats.from_timings(timings, peak_memory)
+
+
+def bench_phases(module: ModuleType, data: str, repeat: int) -> dict[str, Stats]:
+    puzzle = module.parse(data)
+    results = {"parse": measure(module.parse, data, repeat)}
+    for phase in PHASES[1:]:
+        function = getattr(module, phase, None)
+        if function is not None:
+            results[phase] = measure(function, puzzle, repeat)
+
+    return results
+
+
+def bench_day(day: str, repeat: int) -> dict[str, Stats]:
+    return bench_phases(load(day), read_input(day), repeat)
+
+
+def bench_scaling(day: str, scales: list[int], seed: int, repeat: int) -> None:
+    module = load(day)
+    previous: tuple[int, float] | None = None
+    for scale in scales:
+        data = generate(day, scale, seed)
+        results = bench_phases(module, data, repeat)
+
+        # The slope on a log-log plot: 1 for linear, 2 for quadratic and so on.
+        size = len(data)
+        total = sum(stats.median for stats in results.values())
+        exponent = ""
+        if previous is not None and size != previous[0] and previous[1] > 0:
+            growth = math.log(total / previous[1]) / math.log(size / previous[0])
+            exponent = f"{growth:8.2f}"
+        previous = size, total
+
+        phases = " ".join(
+            f"{results[phase].median if phase in results else math.nan:10.4f}"
+            for phase in PHASES
+        )
+        print(f"{day:>3} {scale:>7} {size:>10} {phases} {total:10.4f} {exponent}")
+
+
+def report(day: str, results: dict[str, Stats]) -> None:
+    for phase, stats in results.items():
+        print(
+            f"{day:>3} {phase:<9}"
+            f" {stats.min:10.4f} {stats.median:10.4f} {stats.p95:10.4f}"
+            f" {stats.peak_memory // 1024:10}"
+        )
+
+
+def regressions(
+    baseline: dict[str, dict[str, dict[str, float]]],
+    results: dict[str, dict[str, Stats]],
+    threshold: float,
+) -> list[str]:
+    complaints: list[str] = []
+    for day, phases in results.items():
+        for phase, stats in phases.items():
+            old = baseline.get(day, {}).get(phase)
+            if old is None:
+                continue
+
+            if stats.median - old["median"] < NOISE_FLOOR:
+                continue
+
+            limit = old["median"] * (1 + threshold)
+            if stats.median > limit:
+                change = stats.median / old["median"] - 1
+                complaints.append(
+                    f"Day {day} {phase}: median {stats.median:.4f}s"
+                    f" vs {old['median']:.4f}s baseline ({change:+.0%})"
+                )
+
+    return complaints
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="advent bench")
+    parser.add_argument("days", nargs="?", default="all")
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=Path("bench-baseline.json"))
+    parser.add_argument(
+        "--save", action="store_true", help="overwrite any existing baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fractional slowdown in median time that counts as a regression",
+    )
+    parser.add_argument(
+        "--scaling",
+        metavar="SCALES",
+        help="time generated inputs at eg 50,100,200 rather than the real input",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.scaling is not None:
+        scales = [int(scale) for scale in args.scaling.split(",")]
+        print(
+            f"{'Day':>3} {'Scale':>7} {'Bytes':>10}"
+            f" {'parse (s)':>10} {'one (s)':>10} {'two (s)':>10} {'total (s)':>10}"
+            f" {'exponent':>8}"
+        )
+        for day in parse_days(args.days):
+            bench_scaling(day, scales, args.seed, args.repeat)
+        return 0
+
+    print(
+        f"{'Day':>3} {'Phase':<9}"
+        f" {'min (s)':>10} {'median (s)':>10} {'p95 (s)':>10} {'peak (KiB)':>10}"
+    )
+    results: dict[str, dict[str, Stats]] = {}
+    for day in parse_days(args.days):
+        results[day] = bench_day(day, args.repeat)
+        report(day, results[day])
+
+    if args.save or not args.baseline.exists():
+        serialized = {
+            day: {phase: asdict(stats) for phase, stats in phases.items()}
+            for day, phases in results.items()
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(serialized, f, indent=2)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    complaints = regressions(baseline, results, args.threshold)
+    for complaint in complaints:
+        print(complaint)
+
+    return 1 if complaints else 0
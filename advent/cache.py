@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import ast
+import contextlib
+import hashlib
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from advent.inputs import Buffer
+
+# Imports of other modules in this package, whose source a solver depends on too.
+PACKAGE_IMPORT = re.compile(
+    r"^\s*(?:from advent\.(\w+)|import advent\.(\w+)|from advent import ([\w, ]+))",
+    re.MULTILINE,
+)
+
+# Top-level functions that only consume the parsed input, so that changing them
+# leaves it valid.
+SOLVERS = {"part_one", "part_two", "solve", "solve_lines"}
+
+# Total size of the answer cache before the least recently used answers are evicted.
+ANSWER_CACHE_LIMIT = 1 << 20
+
+
+class ParsedEntry(NamedTuple):
+    path: str
+    input_hash: str
+    parser_hash: str
+    parsed: Any
+
+
+def cache_dir() -> Path:
+    override = os.environ.get("ADVENT_CACHE_DIR")
+    if override is not None:
+        return Path(override)
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "advent"
+
+
+def sha256(data: Buffer) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def package_sources(module: ModuleType) -> dict[Path, bytes]:
+    # The module along with every module of the package that it imports, directly
+    # or not.
+    assert module.__file__ is not None
+    package = Path(module.__file__).parent
+    sources: dict[Path, bytes] = {}
+    pending = [Path(module.__file__)]
+    while pending:
+        path = pending.pop()
+        if path in sources or not path.exists():
+            continue
+
+        sources[path] = path.read_bytes()
+        for match in PACKAGE_IMPORT.finditer(sources[path].decode()):
+            names = match.group(1) or match.group(2) or match.group(3)
+            pending += (package / f"{name.strip()}.py" for name in names.split(","))
+
+    return sources
+
+
+def hash_sources(sources: dict[Path, bytes]) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(sources):
+        digest.update(path.name.encode())
+        digest.update(sources[path])
+
+    return digest.hexdigest()
+
+
+def source_hash(module: ModuleType) -> str:
+    # A change to shared code invalidates the answers of every day using it too.
+    return hash_sources(package_sources(module))
+
+
+def parser_hash(module: ModuleType) -> str:
+    # Like source_hash(), but blind to the solvers in the module itself, so that
+    # working on a part keeps reusing the parsed input.
+    assert module.__file__ is not None
+    sources = package_sources(module)
+    path = Path(module.__file__)
+    tree = ast.parse(sources[path])
+    tree.body = [
+        node
+        for node in tree.body
+        if not (isinstance(node, ast.FunctionDef) and node.name in SOLVERS)
+    ]
+    sources[path] = ast.dump(tree).encode()
+    return hash_sources(sources)
+
+
+def load_pickle(path: Path) -> Any:
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+
+def save_pickle(path: Path, value: Any) -> None:
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Some parsed inputs hold closures, those just don't get cached.
+        return
+
+    # Write then rename, so that concurrent runs never see a partial file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def parse_cached(
+    day: str,
+    module: ModuleType,
+    input: Path,
+    buffer: Buffer,
+    input_hash: str,
+    refresh: bool = False,
+) -> Any:
+    # Each input file gets its own slot, so that switching between inputs for the
+    # same day neither confuses them nor keeps evicting one for the other.
+    path = str(input.resolve())
+    slot = sha256(path.encode())[:16]
+    cache_file = cache_dir() / f"day{day}.{slot}.parsed.pickle"
+    entry = None if refresh else load_pickle(cache_file)
+    code = parser_hash(module)
+    if (
+        isinstance(entry, ParsedEntry)
+        and entry.path == path
+        and entry.input_hash == input_hash
+        and entry.parser_hash == code
+    ):
+        return entry.parsed
+
+    parsed = module.parse(str(buffer, "utf-8"))
+    save_pickle(cache_file, ParsedEntry(path, input_hash, code, parsed))
+    return parsed
+
+
+def answer_path(day: str, part: int, input_hash: str, source_hash: str) -> Path:
+    key = sha256(f"{day}:{part}:{input_hash}:{source_hash}".encode())
+    return cache_dir() / "answers" / f"{key}.pickle"
+
+
+def load_answer(
+    day: str, part: int, input_hash: str, source_hash: str
+) -> int | str | None:
+    path = answer_path(day, part, input_hash, source_hash)
+    answer = load_pickle(path)
+    if not isinstance(answer, (int, str)):
+        return None
+
+    # Touch the file, so that eviction sees that it was recently used.
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+    return answer
+
+
+def save_answer(
+    day: str, part: int, input_hash: str, source_hash: str, answer: int | str
+) -> None:
+    path = answer_path(day, part, input_hash, source_hash)
+    save_pickle(path, answer)
+    evict(path.parent, ANSWER_CACHE_LIMIT)
+
+
+def evict(directory: Path, limit: int) -> None:
+    entries: list[tuple[int, int, Path]] = []
+    for path in directory.glob("*.pickle"):
+        with contextlib.suppress(OSError):
+            stat = path.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    entries.sort()
+    for _, size, path in entries:
+        if total <= limit:
+            break
+
+        with contextlib.suppress(OSError):
+            path.unlink()
+        total -= size
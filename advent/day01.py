@@ -1,8 +1,15 @@
+from __future__ import annotations
+
+import heapq
 import itertools
+from typing import TYPE_CHECKING
 
 from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 @frozen
@@ -13,11 +20,7 @@ class Elf:
         return sum(self.items)
 
 
-def solve() -> None:
-    input = data_dir() / "day01.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
+def parse(data: str) -> list[Elf]:
     elves: list[Elf] = []
     for blank, lines in itertools.groupby(data.splitlines(), lambda line: line == ""):
         if blank:
@@ -27,9 +30,32 @@ def solve() -> None:
         elf = Elf(items)
         elves.append(elf)
 
-    part_one = max(elf.total() for elf in elves)
-    print(f"Part one: {part_one}")
+    return elves
 
+
+def part_one(elves: list[Elf]) -> int:
+    return max(elf.total() for elf in elves)
+
+
+def part_two(elves: list[Elf]) -> int:
     totals = sorted((elf.total() for elf in elves), reverse=True)
-    part_two = sum(totals[:3])
-    print(f"Part two: {part_two}")
+    return sum(totals[:3])
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    # Keep only the three largest totals, as a min-heap.
+    top_three = [0, 0, 0]
+    total = 0
+    for line in itertools.chain(lines, [""]):
+        if line:
+            total += int(line)
+            continue
+
+        heapq.heappushpop(top_three, total)
+        total = 0
+
+    return max(top_three), sum(top_three)
+
+
+def solve() -> None:
+    show(run("01"))
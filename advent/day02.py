@@ -1,8 +1,21 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from advent.utils import data_dir
+from advent.runner import run, show
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from advent.inputs import Buffer
+
+# Raw buffers are counted a chunk at a time, so that a huge mapped file is never
+# copied all at once.
+CHUNK_SIZE = 1 << 20
+
+# Inputs from this many bytes are counted with NumPy, when it is installed.
+NUMPY_MIN_SIZE = 8 << 20
 
 
 class Result(Enum):
@@ -71,25 +84,90 @@ def game_score(mine: Throw, theirs: Throw) -> int:
     return result_score + play_score
 
 
+def round_scores(abc: str, xyz: str) -> tuple[int, int]:
+    their_throw = ABCStrategy[abc]
+    score_one = game_score(XYZStrategy1[xyz], their_throw)
+    score_two = game_score(XYZStrategy2[xyz](their_throw), their_throw)
+    return score_one, score_two
+
+
+# Every round is one of only nine lines, so score each of those once.
+RoundScores = {
+    f"{abc} {xyz}".encode(): round_scores(abc, xyz)
+    for abc in ABCStrategy
+    for xyz in XYZStrategy1
+}
+
+
+def tally_rounds(chunk: bytes) -> list[int]:
+    # How many of each of the nine lines, in the order of RoundScores.
+    return [chunk.count(line) for line in RoundScores]
+
+
+def tally_rounds_numpy(chunk: bytes) -> list[int]:
+    try:
+        import numpy as np
+    except ImportError:
+        return tally_rounds(chunk)
+
+    # When every line is four bytes, "A X\n", NumPy can count them all in one pass.
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    abc = data[0::4] - ord("A")
+    xyz = data[2::4] - ord("X")
+    if not (
+        len(data) % 4 in (0, 3)
+        and (abc < 3).all()
+        and (xyz < 3).all()
+        and (data[1::4] == ord(" ")).all()
+        and (data[3::4] == ord("\n")).all()
+    ):
+        return tally_rounds(chunk)
+
+    return [int(count) for count in np.bincount(abc * 3 + xyz, minlength=9)]
+
+
+def count_rounds(buffer: Buffer) -> dict[bytes, int]:
+    # NumPy takes longer to import than a small input takes to count without it.
+    tally = tally_rounds_numpy if len(buffer) >= NUMPY_MIN_SIZE else tally_rounds
+    counts = dict.fromkeys(RoundScores, 0)
+    start = 0
+    while start < len(buffer):
+        # Cut chunks at line ends, so that no round is split between two chunks.
+        end = buffer.find(b"\n", start + CHUNK_SIZE)
+        end = len(buffer) if end == -1 else end + 1
+        for line, count in zip(counts, tally(buffer[start:end])):
+            counts[line] += count
+        start = end
+
+    return counts
+
+
+def parse(data: str) -> dict[bytes, int]:
+    return count_rounds(data.encode())
+
+
+def parse_buffer(buffer: Buffer) -> dict[bytes, int]:
+    return count_rounds(buffer)
+
+
+def part_one(counts: dict[bytes, int]) -> int:
+    return sum(RoundScores[line][0] * count for line, count in counts.items())
+
+
+def part_two(counts: dict[bytes, int]) -> int:
+    return sum(RoundScores[line][1] * count for line, count in counts.items())
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    score_one = 0
+    score_two = 0
+    for line in lines:
+        one, two = RoundScores[line.encode()]
+        score_one += one
+        score_two += two
+
+    return score_one, score_two
+
+
 def solve() -> None:
-    input = data_dir() / "day02.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
-    score = 0
-    for line in data.splitlines():
-        abc, xyz = line.split(" ")
-        their_throw = ABCStrategy[abc]
-        my_throw = XYZStrategy1[xyz]
-        score += game_score(my_throw, their_throw)
-
-    print(f"Part one: {score}")
-
-    score = 0
-    for line in data.splitlines():
-        abc, xyz = line.split(" ")
-        their_throw = ABCStrategy[abc]
-        my_throw = XYZStrategy2[xyz](their_throw)
-        score += game_score(my_throw, their_throw)
-
-    print(f"Part two: {score}")
+    show(run("02"))
@@ -1,39 +1,75 @@
-from advent.utils import chunks, data_dir
+from __future__ import annotations
 
+import string
+from typing import TYPE_CHECKING, TypeAlias
 
-def priority(letter: str) -> int:
-    lowered = letter.lower()
-    priority = ord(lowered) - ord("a") + 1
+from advent.runner import run, show
+from advent.utils import chunks
 
-    if letter.isupper():
-        priority += 26
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-    return priority
+    from advent.inputs import Buffer
 
+# Each compartment is held as a mask of the item types in it, with a-z and A-Z as
+# bits 0 to 51: so that the bit_length() of a single item is its priority.
+ITEM_BITS = [0] * 256
+for bit, letter in enumerate(string.ascii_letters):
+    ITEM_BITS[ord(letter)] = 1 << bit
 
-def solve() -> None:
-    input = data_dir() / "day03.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+Rucksack: TypeAlias = tuple[int, int]
 
-    lines = data.splitlines()
 
-    total = 0
-    for line in lines:
-        halfway = len(line) // 2
-        compartment_one = line[:halfway]
-        compartment_two = line[halfway:]
-        common = set(compartment_one) & set(compartment_two)
-        item = common.pop()
-        total += priority(item)
+def mask(items: bytes) -> int:
+    bits = 0
+    for item in items:
+        bits |= ITEM_BITS[item]
+
+    return bits
+
+
+def rucksack(line: bytes) -> Rucksack:
+    halfway = len(line) // 2
+    return mask(line[:halfway]), mask(line[halfway:])
+
+
+def parse(data: str) -> list[Rucksack]:
+    return parse_buffer(data.encode())
+
+
+def parse_buffer(buffer: Buffer) -> list[Rucksack]:
+    # Slicing a mapped file copies it into bytes, which splits in one go.
+    return [rucksack(line) for line in buffer[:].splitlines()]
 
-    print(f"Part one: {total}")
 
+def part_one(rucksacks: list[Rucksack]) -> int:
+    return sum((one & two).bit_length() for one, two in rucksacks)
+
+
+def part_two(rucksacks: list[Rucksack]) -> int:
     total = 0
-    for group in chunks(lines, 3):
-        sets = (set(items) for items in group)
-        common = set.intersection(*sets)
-        badge = common.pop()
-        total += priority(badge)
+    for first, second, third in chunks(rucksacks, 3):
+        badge = (first[0] | first[1]) & (second[0] | second[1]) & (third[0] | third[1])
+        total += badge.bit_length()
+
+    return total
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    total_one = 0
+    total_two = 0
+    common = 0
+    for index, line in enumerate(lines):
+        one, two = rucksack(line.encode())
+        total_one += (one & two).bit_length()
 
-    print(f"Part two: {total}")
+        # Narrow down the badge as each elf in the group arrives.
+        common = one | two if index % 3 == 0 else common & (one | two)
+        if index % 3 == 2:
+            total_two += common.bit_length()
+
+    return total_one, total_two
+
+
+def solve() -> None:
+    show(run("03"))
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from operator import itemgetter
+from typing import TYPE_CHECKING, TypeAlias
+
 from attr import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
 
 
 @frozen
@@ -22,26 +29,173 @@ class Range:
         return self.low <= other.high and self.high >= other.low
 
 
-def solve() -> None:
-    input = data_dir() / "day04.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+# A range and its position in the roster.
+Entry: TypeAlias = tuple[int, int, int]
+
+
+@frozen
+class Node:
+    center: int
+    # The ranges that span the center, sorted by ascending low and descending high.
+    by_low: list[Entry]
+    by_high: list[Entry]
+    # Ranges entirely below and above the center.
+    left: Node | None
+    right: Node | None
+
+    @staticmethod
+    def build(entries: list[Entry]) -> Node | None:
+        # Entries arrive sorted by their low end, and splitting them keeps it so.
+        if not entries:
+            return None
+
+        center = entries[len(entries) // 2][0]
+        # Those that start above the center are a run at the end.
+        split = bisect_right(entries, center, key=itemgetter(0))
+        head = entries[:split]
+        below = [entry for entry in head if entry[1] < center]
+        spanning = [entry for entry in head if entry[1] >= center]
+        by_high = sorted(spanning, key=itemgetter(1), reverse=True)
+        return Node(
+            center, spanning, by_high, Node.build(below), Node.build(entries[split:])
+        )
+
+
+@frozen
+class RangeIndex:
+    # A centered interval tree: every node holds at least one range, so a query
+    # visits O(log n) nodes that report nothing, plus those that report something.
+    root: Node | None
+    ranges: Sequence[Range]
+    # For containment: low ends in ascending order with the roster position of each,
+    # and a segment tree over the matching high ends, holding the greatest high end
+    # in each node's span. Leaves start at index len(highest) // 2.
+    lows: list[int]
+    positions: list[int]
+    highest: list[int]
+
+    @staticmethod
+    def build(ranges: Sequence[Range]) -> RangeIndex:
+        entries = sorted((r.low, r.high, index) for index, r in enumerate(ranges))
+
+        leaves = 1
+        while leaves < len(entries):
+            leaves *= 2
+        highest = [-1] * (2 * leaves)
+        highest[leaves : leaves + len(entries)] = [high for _, high, _ in entries]
+        for node in range(leaves - 1, 0, -1):
+            highest[node] = max(highest[2 * node], highest[2 * node + 1])
+
+        return RangeIndex(
+            Node.build(entries),
+            ranges,
+            [low for low, _, _ in entries],
+            [index for _, _, index in entries],
+            highest,
+        )
+
+    def overlapping(self, query: Range) -> list[int]:
+        found: list[int] = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            if query.high < node.center:
+                for low, _, index in node.by_low:
+                    if low > query.high:
+                        break
+                    found.append(index)
+                stack.append(node.left)
+            elif query.low > node.center:
+                for _, high, index in node.by_high:
+                    if high < query.low:
+                        break
+                    found.append(index)
+                stack.append(node.right)
+            else:
+                found += (index for _, _, index in node.by_low)
+                stack += (node.left, node.right)
 
-    pairs = [
+        return found
+
+    def overlapping_all(self, queries: Iterable[Range]) -> list[list[int]]:
+        return [self.overlapping(query) for query in queries]
+
+    def containing(self, query: Range) -> list[int]:
+        # Anything that contains the query starts no later than it, so is among the
+        # first few by low end: of those, report the ones that end no earlier.
+        # Subtrees whose greatest high end falls short are skipped whole, so each
+        # report costs O(log n).
+        count = bisect_right(self.lows, query.low)
+        leaves = len(self.highest) // 2
+        found: list[int] = []
+        stack = [(1, 0, leaves)]
+        while stack:
+            node, start, stop = stack.pop()
+            if start >= count or self.highest[node] < query.high:
+                continue
+
+            if node >= leaves:
+                found.append(self.positions[start])
+                continue
+
+            middle = (start + stop) // 2
+            stack += ((2 * node, start, middle), (2 * node + 1, middle, stop))
+
+        return found
+
+    def contained_pairs(self) -> list[tuple[int, int]]:
+        # Every (outer, inner) pair of positions in the roster such that the outer
+        # range contains the inner one.
+        return [
+            (outer, inner)
+            for inner, r in enumerate(self.ranges)
+            for outer in self.containing(r)
+            if outer != inner
+        ]
+
+
+def parse(data: str) -> list[tuple[Range, ...]]:
+    return [
         tuple(Range.from_str(text) for text in line.split(","))
         for line in data.splitlines()
     ]
 
+
+def part_one(pairs: list[tuple[Range, ...]]) -> int:
     total = 0
     for p in pairs:
         if p[0].contains(p[1]) or p[1].contains(p[0]):
             total += 1
 
-    print(f"Part one: {total}")
+    return total
 
+
+def part_two(pairs: list[tuple[Range, ...]]) -> int:
     total = 0
     for p in pairs:
         if p[0].overlaps(p[1]):
             total += 1
 
-    print(f"Part two: {total}")
+    return total
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    contained = 0
+    overlapping = 0
+    for line in lines:
+        text1, text2 = line.split(",")
+        first, second = Range.from_str(text1), Range.from_str(text2)
+        if first.contains(second) or second.contains(first):
+            contained += 1
+
+        if first.overlaps(second):
+            overlapping += 1
+
+    return contained, overlapping
+
+
+def solve() -> None:
+    show(run("04"))
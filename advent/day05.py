@@ -1,20 +1,8 @@
-import itertools
+from __future__ import annotations
 
-from attrs import frozen
+from attrs import define, frozen
 
-from advent.utils import data_dir
-
-START = [
-    ["Z", "P", "M", "H", "R"],
-    ["P", "C", "J", "B"],
-    ["S", "N", "H", "G", "L", "C", "D"],
-    ["F", "T", "M", "D", "Q", "S", "R", "L"],
-    ["F", "S", "P", "Q", "B", "T", "Z", "M"],
-    ["T", "F", "S", "Z", "B", "G"],
-    ["N", "R", "V"],
-    ["P", "G", "L", "T", "D", "V", "C", "M"],
-    ["W", "Q", "N", "J", "F", "M", "L"],
-]
+from advent.runner import run, show
 
 
 @frozen
@@ -23,42 +11,94 @@ class Move:
     from_: int
     to: int
 
+    @staticmethod
+    def from_line(line: str) -> Move:
+        words = line.split(" ")
+        return Move(int(words[1]), int(words[3]), int(words[5]))
+
 
-def solve() -> None:
-    input = data_dir() / "day05.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+@frozen
+class Procedure:
+    stacks: list[list[str]]
+    moves: list[Move]
+
+
+@define
+class Stacks:
+    # Stack n occupies crates[n * capacity : (n + 1) * capacity], bottom first, and
+    # has room for every crate: so moves never need to grow or shrink any list.
+    crates: list[str]
+    heights: list[int]
+    capacity: int
+
+    @staticmethod
+    def from_lists(stacks: list[list[str]]) -> Stacks:
+        capacity = sum(len(stack) for stack in stacks)
+        crates = [""] * (capacity * len(stacks))
+        for n, stack in enumerate(stacks):
+            start = n * capacity
+            crates[start : start + len(stack)] = stack
+
+        return Stacks(crates, [len(stack) for stack in stacks], capacity)
+
+    def move(self, move: Move, reverse: bool) -> None:
+        source = move.from_ - 1
+        target = move.to - 1
+        top = source * self.capacity + self.heights[source]
+        block = self.crates[top - move.count : top]
+        if reverse:
+            block.reverse()
+
+        bottom = target * self.capacity + self.heights[target]
+        self.crates[bottom : bottom + move.count] = block
+        self.heights[source] -= move.count
+        self.heights[target] += move.count
+
+    def tops(self) -> str:
+        return "".join(
+            self.crates[n * self.capacity + height - 1]
+            for n, height in enumerate(self.heights)
+            if height > 0
+        )
+
+
+def parse_drawing(lines: list[str]) -> list[list[str]]:
+    # The last line numbers the stacks, crate letters line up beneath the numbers.
+    *rows, numbers = lines
+    stacks: list[list[str]] = [[] for _ in numbers.split()]
+    for row in reversed(rows):
+        for n, stack in enumerate(stacks):
+            column = 4 * n + 1
+            if column < len(row) and row[column] != " ":
+                stack.append(row[column])
+
+    return stacks
+
+
+def parse(data: str) -> Procedure:
     lines = data.splitlines()
+    blank = lines.index("")
+    stacks = parse_drawing(lines[:blank])
+    moves = [Move.from_line(line) for line in lines[blank + 1 :] if line]
+    return Procedure(stacks, moves)
 
-    # Skip over the starting configuration, that's done by hand (above).
-    moves: list[Move] = []
-    for line in itertools.dropwhile(lambda line: line != "", lines):
-        if not line:
-            continue
 
-        words = line.split(" ")
-        count, from_, to = int(words[1]), int(words[3]), int(words[5])
-        move = Move(count, from_, to)
-        moves.append(move)
-
-    stacks = [stack[:] for stack in START]
-    for move in moves:
-        from_stack = stacks[move.from_ - 1]
-        to_stack = stacks[move.to - 1]
-        for _ in range(move.count):
-            crate = from_stack.pop()
-            to_stack.append(crate)
-
-    part_one = "".join(stack[-1] for stack in stacks)
-    print(f"Part one: {part_one}")
-
-    stacks = [stack[:] for stack in START]
-    for move in moves:
-        from_stack = stacks[move.from_ - 1]
-        to_stack = stacks[move.to - 1]
-        moved = from_stack[-move.count :]
-        stacks[move.from_ - 1] = from_stack[: -move.count]
-        to_stack += moved
-
-    part_two = "".join(stack[-1] for stack in stacks)
-    print(f"Part two: {part_two}")
+def rearrange(procedure: Procedure, reverse: bool) -> str:
+    stacks = Stacks.from_lists(procedure.stacks)
+    for move in procedure.moves:
+        stacks.move(move, reverse)
+
+    return stacks.tops()
+
+
+def part_one(procedure: Procedure) -> str:
+    # The CrateMover 9000 moves crates one at a time, reversing their order.
+    return rearrange(procedure, reverse=True)
+
+
+def part_two(procedure: Procedure) -> str:
+    return rearrange(procedure, reverse=False)
+
+
+def solve() -> None:
+    show(run("05"))
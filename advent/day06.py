@@ -1,21 +1,65 @@
-from advent.utils import data_dir
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, BinaryIO
 
-def all_different(chars: str) -> bool:
-    return len(chars) == len(set(chars))
+from advent.runner import run, show
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+    from advent.inputs import Buffer
+
+# How much of a datastream to read at a time, when it isn't all in memory.
+CHUNK_SIZE = 1 << 20
+
+
+def find_marker_in_chunks(chunks: Iterable[str | Buffer], size: int) -> int:
+    # Where each character was last seen, and the start of the run of characters
+    # leading up to the current one in which none repeat.
+    last_seen: dict[Hashable, int] = {}
+    start = 0
+    offset = 0
+    for chunk in chunks:
+        for index, char in enumerate(chunk, offset):
+            start = max(start, last_seen.get(char, -1) + 1)
+            last_seen[char] = index
+            if index - start + 1 == size:
+                return index + 1
+
+        offset += len(chunk)
+
+    raise AssertionError("No marker found")
+
+
+def find_marker(data: str | Buffer, size: int) -> int:
+    return find_marker_in_chunks([data], size)
+
+
+def read_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    while chunk := stream.read(CHUNK_SIZE):
+        yield chunk
+
+
+def find_marker_in_stream(stream: BinaryIO, size: int) -> int:
+    return find_marker_in_chunks(read_chunks(stream), size)
+
+
+def parse(data: str) -> str:
+    return data
+
+
+def parse_buffer(buffer: Buffer) -> Buffer:
+    # The datastream is just as good as bytes, so there's no need to decode it.
+    return buffer
+
+
+def part_one(data: str | Buffer) -> int:
+    return find_marker(data, 4)
+
+
+def part_two(data: str | Buffer) -> int:
+    return find_marker(data, 14)
 
 
 def solve() -> None:
-    input = data_dir() / "day06.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
-    for index in range(len(data)):
-        if all_different(data[index : index + 4]):
-            print(f"Part one: {index + 4}")
-            break
-
-    for index in range(len(data)):
-        if all_different(data[index : index + 14]):
-            print(f"Part two: {index + 14}")
-            break
+    show(run("06"))
@@ -1,89 +1,92 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import itertools
+from bisect import bisect_left, bisect_right
 
 from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
-if TYPE_CHECKING:
-    from collections.abc import Iterator
+ROOT = 0
 
 
 @frozen
-class File:
-    name: str
-    size: int
-
-
-@frozen
-class Directory:
-    name: str
-    files: list[File]
-    subdirs: list[Directory]
-    size: int
+class FileSystem:
+    # Directories are numbered as they are first visited, so that every directory
+    # comes after its parent. Sizes include everything in subdirectories.
+    parents: list[int]
+    sizes: list[int]
+    # Keyed by parent and name, as full paths would take quadratic space in a deep
+    # tree.
+    children: dict[tuple[int, str], int]
+    # All the sizes in ascending order, and running totals of them.
+    sorted_sizes: list[int]
+    totals: list[int]
 
     @staticmethod
-    def from_commands(name: str, commands: Iterator[str]) -> Directory:
-        files: list[File] = []
-        subdirs: list[Directory] = []
-        size = 0
-
-        while True:
-            command = next(commands, None)
-
-            # No more commands or changing up a directory completes this directory.
-            if command is None or command == "$ cd ..":
-                return Directory(name, files, subdirs, size)
-
-            # We only need to pay attention to cd commands and file listings.
-            if command.startswith("dir") or command.startswith("$ ls"):
-                continue
-
-            # Changing into a directory creates a new subdirectory.
-            words = command.split(" ")
-            if command.startswith("$ cd"):
-                subdir = Directory.from_commands(words[2], commands)
-                subdirs.append(subdir)
-                size += subdir.size
-                continue
-
-            # Else we have a file.
-            file = File(words[1], int(words[0]))
-            files.append(file)
-            size += file.size
+    def from_commands(commands: list[str]) -> FileSystem:
+        parents = [ROOT]
+        sizes = [0]
+        children: dict[tuple[int, str], int] = {}
+
+        current = ROOT
+        for command in commands:
+            if command == "$ cd /":
+                current = ROOT
+            elif command == "$ cd ..":
+                current = parents[current]
+            elif command.startswith("$ cd "):
+                key = current, command.removeprefix("$ cd ")
+                if key not in children:
+                    children[key] = len(parents)
+                    parents.append(current)
+                    sizes.append(0)
+                current = children[key]
+            elif command[0].isdigit():
+                size, _ = command.split(" ")
+                sizes[current] += int(size)
+
+        # Children come after their parents, so working backwards adds each
+        # directory's total into its parent before the parent is itself added.
+        for number in range(len(sizes) - 1, ROOT, -1):
+            sizes[parents[number]] += sizes[number]
+
+        sorted_sizes = sorted(sizes)
+        totals = list(itertools.accumulate(sorted_sizes, initial=0))
+        return FileSystem(parents, sizes, children, sorted_sizes, totals)
+
+    def size(self, path: str) -> int:
+        number = ROOT
+        for name in path.split("/"):
+            if name:
+                number = self.children[number, name]
+
+        return self.sizes[number]
+
+    def total_at_most(self, limit: int) -> int:
+        return self.totals[bisect_right(self.sorted_sizes, limit)]
+
+    def smallest_at_least(self, needed: int) -> int:
+        index = bisect_left(self.sorted_sizes, needed)
+        if index == len(self.sorted_sizes):
+            raise ValueError(f"No directory of at least {needed}")
+
+        return self.sorted_sizes[index]
+
+
+def parse(data: str) -> FileSystem:
+    return FileSystem.from_commands(data.splitlines())
+
+
+def part_one(fs: FileSystem) -> int:
+    return fs.total_at_most(100000)
+
+
+def part_two(fs: FileSystem) -> int:
+    available = 70000000 - fs.size("/")
+    needed = 30000000 - available
+    return fs.smallest_at_least(needed)
 
 
 def solve() -> None:
-    input = data_dir() / "day07.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
-    lines = data.splitlines()
-    commands = iter(lines)
-
-    # Skip the opening "cd /"
-    next(commands)
-    root = Directory.from_commands("/", commands)
-
-    total = 0
-    stack = [root]
-    while stack:
-        directory = stack.pop()
-        if directory.size <= 100000:
-            total += directory.size
-        stack += directory.subdirs
-
-    print(f"Part one: {total}")
-
-    available = 70000000 - root.size
-    needed = 30000000 - available
-    best_size = root.size
-    stack = [root]
-    while stack:
-        directory = stack.pop()
-        if directory.size >= needed and directory.size < best_size:
-            best_size = directory.size
-        stack += directory.subdirs
-
-    print(f"Part two: {best_size}")
+    show(run("07"))
@@ -1,99 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Heights are single ASCII digits, tallest first.
+HEIGHTS = [ord(digit) for digit in "9876543210"]
+
+
+def taller_than_before(line: bytes) -> Iterator[int]:
+    # Each tree that is taller than all before it is the first of the trees that
+    # are taller than the last one: and there can be at most ten of them.
+    start = 0
+    shortest = 0
+    while True:
+        found = len(line)
+        for height in HEIGHTS[: 10 - shortest]:
+            position = line.find(height, start, found)
+            if position != -1:
+                found = position
+
+        if found == len(line):
+            return
+
+        yield found
+        start = found + 1
+        shortest = line[found] - ord("0") + 1
+
+
+def viewing_distances(line: bytes) -> list[int]:
+    # How far each tree can see back along the line: to the nearest tree at least as
+    # tall, or the edge. The stack holds the trees that might yet block the view,
+    # strictly shorter from bottom to top.
+    distances: list[int] = []
+    stack: list[int] = []
+    for position, height in enumerate(line):
+        while stack and line[stack[-1]] < height:
+            stack.pop()
+        distances.append(position - stack[-1] if stack else position)
+        stack.append(position)
+
+    return distances
 
 
 @frozen
 class Map:
     rows: int
     columns: int
-    trees: dict[tuple[int, int], int]
-
-    def visible(self) -> set[tuple[int, int]]:
-        visible = set()
+    # Row after row, without line breaks, so that a column is a strided slice.
+    trees: bytes
 
+    def lines(self) -> Iterator[tuple[bytes, range]]:
+        # Every row and column, forwards and backwards, with the index into trees of
+        # each of their positions.
         for row in range(self.rows):
-            max = -1
-            for column in range(self.columns):
-                if self.trees[(row, column)] > max:
-                    max = self.trees[(row, column)]
-                    visible.add((row, column))
-
-        for row in range(self.rows):
-            max = -1
-            for column in reversed(range(self.columns)):
-                if self.trees[(row, column)] > max:
-                    max = self.trees[(row, column)]
-                    visible.add((row, column))
+            start = row * self.columns
+            indexes = range(start, start + self.columns)
+            yield self.trees[start : start + self.columns], indexes
+            yield self.trees[start : start + self.columns][::-1], indexes[::-1]
 
         for column in range(self.columns):
-            max = -1
-            for row in range(self.rows):
-                if self.trees[(row, column)] > max:
-                    max = self.trees[(row, column)]
-                    visible.add((row, column))
+            indexes = range(column, len(self.trees), self.columns)
+            yield self.trees[column :: self.columns], indexes
+            yield self.trees[column :: self.columns][::-1], indexes[::-1]
 
-        for column in range(self.columns):
-            max = -1
-            for row in reversed(range(self.rows)):
-                if self.trees[(row, column)] > max:
-                    max = self.trees[(row, column)]
-                    visible.add((row, column))
+    def visible(self) -> set[int]:
+        visible: set[int] = set()
+        for line, indexes in self.lines():
+            visible.update(indexes[position] for position in taller_than_before(line))
 
         return visible
 
-    def scenic_score(self, position: tuple[int, int]) -> int:
-        start_height = self.trees[position]
-        row, column = position
+    def scenic_scores(self) -> list[int]:
+        scores = [1] * len(self.trees)
+        for line, indexes in self.lines():
+            for index, distance in zip(indexes, viewing_distances(line)):
+                scores[index] *= distance
 
-        up = 0
-        for i in reversed(range(row)):
-            up += 1
-            if self.trees[(i, column)] >= start_height:
-                break
+        return scores
 
-        down = 0
-        for i in range(row + 1, self.rows):
-            down += 1
-            if self.trees[(i, column)] >= start_height:
-                break
 
-        left = 0
-        for j in reversed(range(column)):
-            left += 1
-            if self.trees[(row, j)] >= start_height:
-                break
+def parse(data: str) -> Map:
+    lines = data.splitlines()
+    rows = len(lines)
+    columns = len(lines[0])
+    return Map(rows, columns, "".join(lines).encode())
 
-        right = 0
-        for j in range(column + 1, self.columns):
-            right += 1
-            if self.trees[(row, j)] >= start_height:
-                break
 
-        return up * down * left * right
+def part_one(map: Map) -> int:
+    return len(map.visible())
 
 
-def solve() -> None:
-    input = data_dir() / "day08.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
-    trees: dict[tuple[int, int], int] = {}
-    for row, line in enumerate(data.splitlines()):
-        for column, height in enumerate(line):
-            trees[(row, column)] = int(height)
-
-    rows = row + 1
-    columns = column + 1
-    map = Map(rows, columns, trees)
+def part_two(map: Map) -> int:
+    return max(map.scenic_scores())
 
-    print(f"Part one: {len(map.visible())}")
 
-    max = 0
-    for i in range(rows):
-        for j in range(columns):
-            score = map.scenic_score((i, j))
-            if score > max:
-                max = score
-
-    print(f"Part two: {max}")
+def solve() -> None:
+    show(run("08"))
@@ -1,20 +1,12 @@
-from attrs import frozen
+from __future__ import annotations
 
-from advent.utils import data_dir
+import itertools
+from typing import TYPE_CHECKING
 
+from advent.runner import run, show
 
-def sign(n: int) -> int:
-    if n == 0:
-        return 0
-
-    return n // abs(n)
-
-
-@frozen
-class Position:
-    x: int
-    y: int
-
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 MOVEMENT = {
     "U": (0, 1),
@@ -24,54 +16,108 @@ MOVEMENT = {
 }
 
 
+def stride(start: int, step: int, count: int) -> Iterable[int]:
+    # The next count values of a coordinate moving by step each time.
+    if step == 0:
+        return itertools.repeat(start, count)
+
+    return range(start + step, start + step * (count + 1), step)
+
+
 class Rope:
     def __init__(self, count: int) -> None:
-        self.knots = [Position(0, 0)] * count
-
-    def move(self, direction: str) -> None:
+        self.xs = [0] * count
+        self.ys = [0] * count
+
+    def step(self, dx: int, dy: int) -> tuple[int, bool]:
+        # Returns how many knots moved, and whether they all moved exactly as the
+        # head did.
+        xs = self.xs
+        ys = self.ys
+        xs[0] += dx
+        ys[0] += dy
+
+        uniform = True
+        for n in range(1, len(xs)):
+            ox = xs[n - 1] - xs[n]
+            oy = ys[n - 1] - ys[n]
+            if -1 <= ox <= 1 and -1 <= oy <= 1:
+                # A knot at rest leaves all the knots behind it at rest too.
+                return n, False
+
+            sx = (ox > 0) - (ox < 0)
+            sy = (oy > 0) - (oy < 0)
+            xs[n] += sx
+            ys[n] += sy
+            uniform = uniform and sx == dx and sy == dy
+
+        return len(xs), uniform
+
+    def shift(self, dx: int, dy: int) -> None:
+        self.xs = [x + dx for x in self.xs]
+        self.ys = [y + dy for y in self.ys]
+
+
+def tail_positions_many(
+    motions: Iterable[tuple[str, int]], lengths: list[int]
+) -> dict[int, int]:
+    # The tail of a shorter rope moves just as the same knot of a longer rope does,
+    # so one rope gives the answer for every length.
+    rope = Rope(max(lengths))
+    visited = {length: {(0, 0)} for length in lengths}
+
+    for direction, count in motions:
         dx, dy = MOVEMENT[direction]
-        head = self.knots[0]
-        self.knots[0] = Position(x=head.x + dx, y=head.y + dy)
+        remaining = count
+        while remaining > 0:
+            remaining -= 1
+            moved, uniform = rope.step(dx, dy)
+            for length, positions in visited.items():
+                if moved >= length:
+                    positions.add((rope.xs[length - 1], rope.ys[length - 1]))
 
-        for knot in range(1, len(self.knots)):
-            self.update_knot(knot)
+            if not uniform:
+                continue
 
-    def update_knot(self, n: int) -> None:
-        leader = self.knots[n - 1]
-        follower = self.knots[n]
+            # Every knot followed the head, so the shape of the rope is unchanged and
+            # the rest of the motion will just slide it along in a straight line.
+            for length, positions in visited.items():
+                x = rope.xs[length - 1]
+                y = rope.ys[length - 1]
+                positions.update(
+                    zip(stride(x, dx, remaining), stride(y, dy, remaining))
+                )
+            rope.shift(dx * remaining, dy * remaining)
+            remaining = 0
 
-        if abs(leader.x - follower.x) <= 1 and abs(leader.y - follower.y) <= 1:
-            return
+    return {length: len(positions) for length, positions in visited.items()}
 
-        dx = sign(leader.x - follower.x)
-        dy = sign(leader.y - follower.y)
 
-        self.knots[n] = Position(x=follower.x + dx, y=follower.y + dy)
+def tail_positions(motions: list[tuple[str, int]], length: int) -> int:
+    return tail_positions_many(motions, [length])[length]
 
 
-def solve() -> None:
-    input = data_dir() / "day09.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse_motion(line: str) -> tuple[str, int]:
+    direction, count = line.split(" ")
+    return direction, int(count)
+
+
+def parse(data: str) -> list[tuple[str, int]]:
+    return [parse_motion(line) for line in data.splitlines()]
 
-    rope = Rope(2)
-    visited = {rope.knots[-1]}
 
-    for line in data.splitlines():
-        direction, count = line.split(" ")
-        for _ in range(int(count)):
-            rope.move(direction)
-            visited.add(rope.knots[-1])
+def part_one(motions: list[tuple[str, int]]) -> int:
+    return tail_positions(motions, 2)
 
-    print(f"Part one: {len(visited)}")
 
-    rope = Rope(10)
-    visited = {rope.knots[-1]}
+def part_two(motions: list[tuple[str, int]]) -> int:
+    return tail_positions(motions, 10)
 
-    for line in data.splitlines():
-        direction, count = line.split(" ")
-        for _ in range(int(count)):
-            rope.move(direction)
-            visited.add(rope.knots[-1])
 
-    print(f"Part two: {len(visited)}")
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    counts = tail_positions_many((parse_motion(line) for line in lines), [2, 10])
+    return counts[2], counts[10]
+
+
+def solve() -> None:
+    show(run("09"))
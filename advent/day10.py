@@ -3,12 +3,12 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
-from attrs import define, frozen
+from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable
 
 
 class Instruction(ABC):
@@ -28,8 +28,9 @@ class Instruction(ABC):
     def cycles(self) -> int:
         ...
 
+    @property
     @abstractmethod
-    def apply(self, cpu: CPU) -> None:
+    def delta(self) -> int:
         ...
 
 
@@ -39,8 +40,9 @@ class NoOp(Instruction):
     def cycles(self) -> int:
         return 1
 
-    def apply(self, cpu: CPU) -> None:
-        pass
+    @property
+    def delta(self) -> int:
+        return 0
 
 
 @frozen
@@ -51,54 +53,55 @@ class Addx(Instruction):
     def cycles(self) -> int:
         return 2
 
-    def apply(self, cpu: CPU) -> None:
-        cpu.x += self.value
+    @property
+    def delta(self) -> int:
+        return self.value
 
 
-@define
-class CPU:
-    program: Iterator[Instruction]
-    x: int = 1
-    active: Instruction | None = None
-    active_age: int = 0
+@frozen
+class Trace:
+    # The value of X during each cycle, counting from cycle 1 at index 0.
+    xs: list[int]
 
-    def tick(self) -> None:
-        if self.active is not None:
-            self.active_age += 1
+    @staticmethod
+    def compile(instructions: Iterable[Instruction]) -> Trace:
+        xs: list[int] = []
+        x = 1
+        for instruction in instructions:
+            # X only changes once an instruction has finished.
+            xs += [x] * instruction.cycles
+            x += instruction.delta
 
-            if self.active_age == self.active.cycles:
-                self.active.apply(self)
-                self.active = None
-                self.active_age = 0
+        return Trace(xs)
 
-        if self.active is None:
-            self.active = next(self.program)
+    def x(self, cycle: int) -> int:
+        return self.xs[cycle - 1]
 
+    def signal_strength(self, cycles: Iterable[int]) -> int:
+        return sum(cycle * self.x(cycle) for cycle in cycles)
 
-def solve() -> None:
-    input = data_dir() / "day10.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
 
-    instructions = [Instruction.from_text(line) for line in data.splitlines()]
+def parse(data: str) -> Trace:
+    return Trace.compile(Instruction.from_text(line) for line in data.splitlines())
 
-    cpu = CPU(program=iter(instructions))
-    total = 0
-    for cycle in range(1, 221):
-        cpu.tick()
-        if (cycle % 40) == 20:
-            total += cycle * cpu.x
 
-    print(f"Part one: {total}")
+def part_one(trace: Trace) -> int:
+    return trace.signal_strength(range(20, 221, 40))
 
-    cpu = CPU(program=iter(instructions))
-    screen = [[" "] * 40 for _ in range(6)]
+
+def part_two(trace: Trace) -> str:
+    rows: list[str] = []
     for row in range(6):
-        for column in range(40):
-            cpu.tick()
-            if cpu.x - 1 <= column <= cpu.x + 1:
-                screen[row][column] = "#"
-
-    print("Part two:")
-    for line in screen:
-        print("".join(line))
+        sprites = trace.xs[row * 40 : (row + 1) * 40]
+        rows.append(
+            "".join(
+                "#" if x - 1 <= column <= x + 1 else " "
+                for column, x in enumerate(sprites)
+            )
+        )
+
+    return "\n".join(rows)
+
+
+def solve() -> None:
+    show(run("10"))
@@ -2,26 +2,31 @@ from __future__ import annotations
 
 import itertools
 import operator
-from copy import deepcopy
 from functools import reduce
 from typing import TYPE_CHECKING
 
-from attrs import define
+from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Iterator
 
 
-@define
+# Operation codes: each monkey either adds a constant, multiplies by one, or squares.
+ADD = 0
+MULTIPLY = 1
+SQUARE = 2
+
+
+@frozen
 class Monkey:
     items: list[int]
-    operation: Callable[[int], int]
+    op: int
+    operand: int
     divisibility_test: int
     if_true: int
     if_false: int
-    inspections: int = 0
 
     @staticmethod
     def from_text(lines: Iterator[str]) -> Monkey:
@@ -32,13 +37,13 @@ class Monkey:
         items = [int(word) for word in words]
 
         words = next(lines).removeprefix("  Operation: new = old ").split(" ")
-        op = operator.add if words[0] == "+" else operator.mul
-        operand = words[1]
-        operation = (
-            (lambda old: op(old, old))
-            if operand == "old"
-            else (lambda old: op(old, int(operand)))
-        )
+        if words[1] != "old":
+            op = ADD if words[0] == "+" else MULTIPLY
+            operand = int(words[1])
+        elif words[0] == "+":
+            op, operand = MULTIPLY, 2
+        else:
+            op, operand = SQUARE, 0
 
         word = next(lines).removeprefix("  Test: divisible by ")
         divisibility_test = int(word)
@@ -49,30 +54,53 @@ class Monkey:
         word = next(lines).removeprefix("    If false: throw to monkey ")
         if_false = int(word)
 
-        return Monkey(items, operation, divisibility_test, if_true, if_false)
-
-    def turn(self, lcm: int | None = None) -> list[tuple[int, int]]:
-        results: list[tuple[int, int]] = []
+        return Monkey(items, op, operand, divisibility_test, if_true, if_false)
 
-        while self.items:
-            item = self.items.pop()
-            item = self.operation(item)
-            item = item // 3 if lcm is None else item % lcm
-            target = (
-                self.if_true if (item % self.divisibility_test) == 0 else self.if_false
-            )
-            results.append((target, item))
 
-            self.inspections += 1
+@frozen
+class Troop:
+    # Every monkey's rules, as one table per field, indexed by monkey.
+    ops: list[int]
+    operands: list[int]
+    tests: list[int]
+    if_true: list[int]
+    if_false: list[int]
 
-        return results
-
-
-def solve() -> None:
-    input = data_dir() / "day11.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+    @staticmethod
+    def compile(monkeys: list[Monkey]) -> Troop:
+        return Troop(
+            [monkey.op for monkey in monkeys],
+            [monkey.operand for monkey in monkeys],
+            [monkey.divisibility_test for monkey in monkeys],
+            [monkey.if_true for monkey in monkeys],
+            [monkey.if_false for monkey in monkeys],
+        )
 
+    def inspect(self, monkey: int, worry: int) -> int:
+        op = self.ops[monkey]
+        if op == ADD:
+            return worry + self.operands[monkey]
+        if op == MULTIPLY:
+            return worry * self.operands[monkey]
+        return worry * worry
+
+    def inspect_all(self, monkey: int, worries: list[int]) -> list[int]:
+        # The whole batch goes through one comprehension, rather than a call apiece.
+        op = self.ops[monkey]
+        operand = self.operands[monkey]
+        if op == ADD:
+            return [worry + operand for worry in worries]
+        if op == MULTIPLY:
+            return [worry * operand for worry in worries]
+        return [worry * worry for worry in worries]
+
+    def target(self, monkey: int, worry: int) -> int:
+        if worry % self.tests[monkey] == 0:
+            return self.if_true[monkey]
+        return self.if_false[monkey]
+
+
+def parse(data: str) -> list[Monkey]:
     start: list[Monkey] = []
     for blank, lines in itertools.groupby(data.splitlines(), lambda line: line == ""):
         if blank:
@@ -81,21 +109,105 @@ def solve() -> None:
         monkey = Monkey.from_text(lines)
         start.append(monkey)
 
-    monkeys = deepcopy(start)
-    for _round in range(20):
-        for monkey in monkeys:
-            for target, item in monkey.turn():
-                monkeys[target].items.append(item)
-
-    inspections = sorted([monkey.inspections for monkey in monkeys], reverse=True)
-    print(f"Part one: {inspections[0] * inspections[1]}")
-
-    monkeys = deepcopy(start)
+    return start
+
+
+def play_rounds(monkeys: list[Monkey], rounds: int, lcm: int | None) -> list[int]:
+    # Without a modulus, worry is divided by three after each inspection.
+    troop = Troop.compile(monkeys)
+    held = [monkey.items[:] for monkey in monkeys]
+    counts = [0] * len(monkeys)
+    for _round in range(rounds):
+        for monkey, worries in enumerate(held):
+            counts[monkey] += len(worries)
+            worries = troop.inspect_all(monkey, worries)
+            if lcm is None:
+                worries = [worry // 3 for worry in worries]
+            else:
+                worries = [worry % lcm for worry in worries]
+
+            test = troop.tests[monkey]
+            held[troop.if_true[monkey]] += [
+                worry for worry in worries if worry % test == 0
+            ]
+            held[troop.if_false[monkey]] += [
+                worry for worry in worries if worry % test != 0
+            ]
+            held[monkey] = []
+
+    return counts
+
+
+def item_inspections(
+    troop: Troop, monkey: int, worry: int, rounds: int, lcm: int
+) -> list[int]:
+    # Items never affect each other, so follow just the one. Each round is a list
+    # of the monkeys that inspect it: a throw to a later monkey is inspected again
+    # in the same round, a throw to an earlier one waits for the next.
+    history: list[list[int]] = []
+    seen: dict[tuple[int, int], int] = {}
+    while len(history) < rounds and (monkey, worry) not in seen:
+        seen[monkey, worry] = len(history)
+        inspected: list[int] = []
+        while True:
+            inspected.append(monkey)
+            worry = troop.inspect(monkey, worry) % lcm
+            target = troop.target(monkey, worry)
+            if target < monkey:
+                break
+            monkey = target
+        monkey = target
+        history.append(inspected)
+
+    counts = [0] * len(troop.ops)
+    for inspected in history:
+        for inspector in inspected:
+            counts[inspector] += 1
+
+    if len(history) == rounds:
+        return counts
+
+    # Having come back to a state seen before, the item repeats the same rounds
+    # forever: so count whole cycles at once, and then the part of one left over.
+    start = seen[monkey, worry]
+    cycle = history[start:]
+    repeats, left_over = divmod(rounds - len(history), len(cycle))
+    per_cycle = [0] * len(troop.ops)
+    for inspected in cycle:
+        for inspector in inspected:
+            per_cycle[inspector] += 1
+    for inspected in cycle[:left_over]:
+        for inspector in inspected:
+            counts[inspector] += 1
+
+    return [count + repeats * extra for count, extra in zip(counts, per_cycle)]
+
+
+def inspections(monkeys: list[Monkey], rounds: int, lcm: int) -> list[int]:
+    troop = Troop.compile(monkeys)
+    totals = [0] * len(monkeys)
+    for number, monkey in enumerate(monkeys):
+        for worry in monkey.items:
+            counts = item_inspections(troop, number, worry, rounds, lcm)
+            totals = [total + count for total, count in zip(totals, counts)]
+
+    return totals
+
+
+def monkey_business(inspections: list[int]) -> int:
+    busiest = sorted(inspections, reverse=True)
+    return busiest[0] * busiest[1]
+
+
+def part_one(monkeys: list[Monkey]) -> int:
+    return monkey_business(play_rounds(monkeys, 20, lcm=None))
+
+
+def part_two(monkeys: list[Monkey], rounds: int = 10000) -> int:
+    # Tests only care about divisibility, so worry can be kept modulo all of them.
     lcm = reduce(operator.mul, (m.divisibility_test for m in monkeys))
-    for _round in range(10000):
-        for monkey in monkeys:
-            for target, item in monkey.turn(lcm=lcm):
-                monkeys[target].items.append(item)
+    return monkey_business(inspections(monkeys, rounds, lcm))
+
 
-    inspections = sorted([monkey.inspections for monkey in monkeys], reverse=True)
-    print(f"Part two: {inspections[0] * inspections[1]}")
+def solve() -> None:
+    show(run("11"))
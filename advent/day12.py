@@ -1,83 +1,123 @@
 from __future__ import annotations
 
-from collections import deque
+import string
 from typing import TYPE_CHECKING
 
-from attrs import frozen
+from attrs import field, frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
+from advent.search import UNREACHABLE, Graph, astar, bidirectional_bfs, distance_field
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from array import array
+    from collections.abc import Callable, Iterator
 
+    from advent.search import Route
 
-@frozen
-class Cell:
-    x: int
-    y: int
+# Maps each letter of the input to its height, with S and E at the ends of the scale.
+HEIGHTS = bytes.maketrans(
+    string.ascii_lowercase.encode() + b"SE", bytes(range(26)) + bytes([0, 25])
+)
 
 
 @frozen
-class HeightMap:
-    heights: dict[Cell, int]
-    start: Cell
-    end: Cell
-
-    def neighbours(self, cell: Cell) -> Iterable[Cell]:
-        height = self.heights[cell]
-        moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        for dx, dy in moves:
-            neighbour = Cell(cell.x + dx, cell.y + dy)
-            neighbour_height = self.heights.get(neighbour)
-            if neighbour_height is not None and neighbour_height <= height + 1:
+class HeightMap(Graph):
+    width: int
+    # One byte per cell, row after row: cell numbers are y * width + x.
+    heights: bytes
+    start: int
+    end: int
+    # Distance fields already found for distance() queries, by the cell that they
+    # lead to. The parts don't use these, so as not to change the parsed map. Being
+    # only a memo, they don't count towards equality or hashing either.
+    fields: dict[int, array[int]] = field(factory=dict, eq=False, repr=False)
+
+    def cell(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def neighbours(self, cell: int) -> Iterator[int]:
+        x = cell % self.width
+        if x > 0:
+            yield cell - 1
+        if x < self.width - 1:
+            yield cell + 1
+        if cell >= self.width:
+            yield cell - self.width
+        if cell + self.width < len(self.heights):
+            yield cell + self.width
+
+    @property
+    def size(self) -> int:
+        return len(self.heights)
+
+    def successors(self, cell: int) -> Iterator[int]:
+        # A step down may be of any size, but a step up only of one.
+        highest = self.heights[cell] + 1
+        for neighbour in self.neighbours(cell):
+            if self.heights[neighbour] <= highest:
+                yield neighbour
+
+    def predecessors(self, cell: int) -> Iterator[int]:
+        lowest = self.heights[cell] - 1
+        for neighbour in self.neighbours(cell):
+            if self.heights[neighbour] >= lowest:
                 yield neighbour
 
-    def get_route_length(self, part_one: bool = True) -> int:
-        visited = (
-            {self.start}
-            if part_one
-            else {cell for cell, height in self.heights.items() if height == 0}
-        )
-        queue = deque((cell, 0) for cell in visited)
-        while queue:
-            cell, distance = queue.popleft()
-            if cell == self.end:
-                return distance
+    def distances_to(self, goal: int) -> array[int]:
+        distances = self.fields.get(goal)
+        if distances is None:
+            distances = distance_field(self, goal)
+            self.fields[goal] = distances
+
+        return distances
+
+    def distance(self, cell: int, goal: int | None = None) -> int:
+        return self.distances_to(self.end if goal is None else goal)[cell]
+
+    def heuristic(self, goal: int) -> Callable[[int], int]:
+        # Every step moves one cell and climbs at most one, so the route is at least
+        # as long as both the distance and the climb to the goal.
+        gy, gx = divmod(goal, self.width)
+        goal_height = self.heights[goal]
+
+        def estimate(cell: int) -> int:
+            y, x = divmod(cell, self.width)
+            return max(abs(x - gx) + abs(y - gy), goal_height - self.heights[cell])
+
+        return estimate
+
+    def route(
+        self,
+        start: int,
+        goal: int,
+        with_path: bool = False,
+        bidirectional: bool = False,
+    ) -> Route | None:
+        if bidirectional:
+            return bidirectional_bfs(self, start, goal, with_path)
+
+        return astar(self, start, goal, self.heuristic(goal), with_path)
+
+
+def parse(data: str) -> HeightMap:
+    lines = data.encode().splitlines()
+    letters = b"".join(lines)
+    heights = letters.translate(HEIGHTS)
+    return HeightMap(len(lines[0]), heights, letters.index(b"S"), letters.index(b"E"))
+
+
+def part_one(map: HeightMap) -> int:
+    return distance_field(map, map.end)[map.start]
 
-            for neighbour in self.neighbours(cell):
-                if neighbour not in visited:
-                    visited.add(neighbour)
-                    queue.append((neighbour, distance + 1))
 
-        raise AssertionError
+def part_two(map: HeightMap) -> int:
+    to_end = distance_field(map, map.end)
+    return min(
+        distance
+        for height, distance in zip(map.heights, to_end)
+        if height == 0 and distance != UNREACHABLE
+    )
 
 
 def solve() -> None:
-    input = data_dir() / "day12.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
-    heights: dict[Cell, int] = {}
-    start = None
-    end = None
-    for y, line in enumerate(data.splitlines()):
-        for x, char in enumerate(line):
-            cell = Cell(x, y)
-            if char == "S":
-                start = cell
-                height = 0
-            elif char == "E":
-                end = cell
-                height = 25
-            else:
-                height = ord(char) - ord("a")
-
-            heights[cell] = height
-
-    assert start is not None
-    assert end is not None
-    map = HeightMap(heights, start, end)
-
-    print(f"Part one: {map.get_route_length()}")
-    print(f"Part two: {map.get_route_length(part_one=False)}")
+    show(run("12"))
@@ -1,100 +1,120 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from bisect import bisect_left
 
 from attrs import frozen
 
-from advent.utils import chunks, data_dir
+from advent.runner import run, show
+from advent.utils import chunks
 
-if TYPE_CHECKING:
-    from collections.abc import Iterator
+# Packets are flattened to tokens: brackets are these, and numbers stand for
+# themselves.
+OPEN = -1
+CLOSE = -2
 
 
-@frozen(order=False)
-class Packet:
-    subpackets: list[int | Packet]
+def tokenize(line: str) -> tuple[int, ...]:
+    text = line.replace("[", f"{OPEN},").replace("]", f",{CLOSE}")
+    return tuple(int(token) for token in text.split(",") if token)
 
-    @staticmethod
-    def from_text(letters: Iterator[str]) -> Packet:
-        subpackets: list[int | Packet] = []
-
-        number = None
-        while True:
-            letter = next(letters, None)
-
-            if letter is None or letter == "]":
-                if number is not None:
-                    subpackets.append(number)
-                return Packet(subpackets)
-
-            if letter == ",":
-                if number is not None:
-                    subpackets.append(number)
-                number = None
-                continue
-
-            if letter == "[":
-                subpacket = Packet.from_text(letters)
-                subpackets.append(subpacket)
-                continue
-
-            if number is None:
-                number = 0
-            number *= 10
-            number += int(letter)
 
-    def cmp(self, other: Packet) -> int:
-        for left, right in zip(self.subpackets, other.subpackets):
-            if isinstance(left, int) and isinstance(right, int):
-                if left < right:
-                    return -1
-                if left > right:
-                    return 1
+def compare(left: tuple[int, ...], right: tuple[int, ...]) -> int:
+    # Walks both token streams together. A number compared with a list is treated
+    # as a list of just that number: so it gets wrapped in virtual brackets, the
+    # opening ones matched as they arise and the closing ones pending until after
+    # the number.
+    i = j = 0
+    wrap_left = wrap_right = 0
+    close_left = close_right = 0
+    while i < len(left):
+        a = CLOSE if close_left else left[i]
+        b = CLOSE if close_right else right[j]
 
+        if a == b:
+            if close_left:
+                close_left -= 1
             else:
-                subl = Packet([left]) if isinstance(left, int) else left
-                subr = Packet([right]) if isinstance(right, int) else right
-                inner = subl.cmp(subr)
-                if inner != 0:
-                    return inner
+                i += 1
+                if a >= 0:
+                    close_left, wrap_left = wrap_left, 0
 
-        if len(self.subpackets) < len(other.subpackets):
-            return -1
+            if close_right:
+                close_right -= 1
+            else:
+                j += 1
+                if b >= 0:
+                    close_right, wrap_right = wrap_right, 0
 
-        if len(self.subpackets) > len(other.subpackets):
+        elif a >= 0 and b >= 0:
+            return -1 if a < b else 1
+        elif a == CLOSE:
+            return -1
+        elif b == CLOSE:
             return 1
+        elif a == OPEN:
+            i += 1
+            wrap_right += 1
+        else:
+            j += 1
+            wrap_left += 1
 
-        return 0
+    return 0
 
-    def __lt__(self, other: Packet) -> bool:
-        return self.cmp(other) == -1
 
+@frozen(order=False)
+class Packet:
+    tokens: tuple[int, ...]
 
-def solve() -> None:
-    input = data_dir() / "day13.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+    @staticmethod
+    def from_line(line: str) -> Packet:
+        return Packet(tokenize(line))
 
-    packets: list[Packet] = []
-    for line in data.splitlines():
-        if not line:
-            continue
+    def cmp(self, other: Packet) -> int:
+        return compare(self.tokens, other.tokens)
 
-        letters = iter(line)
-        next(letters)
-        packet = Packet.from_text(letters)
-        packets.append(packet)
+    def __lt__(self, other: Packet) -> bool:
+        # Packets are their own sort key: sorting calls this directly, with no
+        # wrapper objects from cmp_to_key.
+        return compare(self.tokens, other.tokens) < 0
+
+
+def parse(data: str) -> list[Packet]:
+    return [Packet.from_line(line) for line in data.splitlines() if line]
 
+
+def part_one(packets: list[Packet]) -> int:
     total = 0
     for index, pair in enumerate(chunks(packets, 2), 1):
         if pair[0] < pair[1]:
             total += index
 
-    print(f"Part one: {total}")
+    return total
+
+
+def ranks(packets: list[Packet], probes: list[Packet]) -> list[int]:
+    # Where each probe would land, counting from one, if the probes were sorted in
+    # among the packets: found by sorting only the probes, and placing each packet
+    # between them. Packets go before any probes that they equal.
+    order = sorted(range(len(probes)), key=probes.__getitem__)
+    sorted_probes = [probes[index] for index in order]
+    gaps = [0] * (len(probes) + 1)
+    for packet in packets:
+        gaps[bisect_left(sorted_probes, packet)] += 1
 
-    dividers = (Packet([Packet([2])]), Packet([Packet([6])]))
-    packets += dividers
-    packets.sort()
-    idx1 = packets.index(dividers[0])
-    idx2 = packets.index(dividers[1])
-    print(f"Part two: {(idx1 + 1) * (idx2 + 1)}")
+    positions = [0] * len(probes)
+    below = 0
+    for place, index in enumerate(order):
+        below += gaps[place]
+        positions[index] = below + place + 1
+
+    return positions
+
+
+def part_two(packets: list[Packet]) -> int:
+    dividers = [Packet.from_line("[[2]]"), Packet.from_line("[[6]]")]
+    first, second = ranks(packets, dividers)
+    return first * second
+
+
+def solve() -> None:
+    show(run("13"))
@@ -1,86 +1,104 @@
-from copy import deepcopy
+from __future__ import annotations
 
-from attrs import Factory, define, frozen
+from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
+SOURCE = (500, 0)
 
-@frozen
-class Cell:
-    x: int
-    y: int
-
-
-@define
-class Map:
-    occupied: set[Cell] = Factory(set)
-    maxy: int = 0
-
-    def add_rock_path(self, text: str) -> None:
-        cells: list[Cell] = []
-        for word in text.split(" "):
-            if word == "->":
-                continue
-
-            x, y = word.split(",")
-            cell = Cell(int(x), int(y))
-            cells.append(cell)
-
-        for c1, c2 in zip(cells, cells[1:]):
-            self.add_rock_line(c1, c2)
-
-    def add_rock_line(self, c1: Cell, c2: Cell) -> None:
-        x1, x2 = (c1.x, c2.x) if c1.x <= c2.x else (c2.x, c1.x)
-        y1, y2 = (c1.y, c2.y) if c1.y <= c2.y else (c2.y, c1.y)
-        for x in range(x1, x2 + 1):
-            for y in range(y1, y2 + 1):
-                self.occupied.add(Cell(x, y))
-                self.maxy = max(self.maxy, y)
-
-    def add_sand(self, start: Cell, floor: bool = False) -> bool:
-        if start in self.occupied:
-            return False
-
-        x, y = start.x, start.y
-        while True:
-            if not floor and y == self.maxy:
-                return False
-
-            if y == self.maxy + 1:
-                self.occupied.add(Cell(x, y))
-                return True
-
-            for dx in (0, -1, 1):
-                candidate = Cell(x + dx, y + 1)
-                if candidate not in self.occupied:
-                    x = x + dx
-                    y = y + 1
-                    break
-
-            else:
-                self.occupied.add(Cell(x, y))
-                return True
-
-
-def solve() -> None:
-    input = data_dir() / "day14.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+AIR = 0
+SOLID = 1
 
-    slice = Map()
-    for line in data.splitlines():
-        slice.add_rock_path(line)
 
-    count = 0
-    start = Cell(500, 0)
-    part1 = deepcopy(slice)
-    while part1.add_sand(start):
-        count += 1
-
-    print(f"Part one: {count}")
+@frozen
+class Cave:
+    # One byte per cell, row after row, with column zero at x = left. Sand can only
+    # drift one column per row as it falls, so nothing outside the triangle below
+    # the source matters, and the grid ends on the row above the floor.
+    width: int
+    left: int
+    maxy: int
+    grid: bytes
+
+    @staticmethod
+    def from_paths(paths: list[list[tuple[int, int]]]) -> Cave:
+        maxy = max(y for path in paths for _, y in path)
+        reach = maxy + 3
+        left = SOURCE[0] - reach
+        width = 2 * reach + 1
+        grid = bytearray(width * (maxy + 2))
+
+        for path in paths:
+            for (x1, y1), (x2, y2) in zip(path, path[1:]):
+                x1, x2 = sorted((x1, x2))
+                y1, y2 = sorted((y1, y2))
+                x1, x2 = max(x1, left), min(x2, left + width - 1)
+                if x1 > x2:
+                    continue
+
+                # Lines are straight, so each is one slice: contiguous along a row,
+                # strided down a column.
+                start = y1 * width + x1 - left
+                stop = y2 * width + x2 - left + 1
+                step = 1 if y1 == y2 else width
+                grid[start:stop:step] = bytes([SOLID]) * len(range(start, stop, step))
+
+        return Cave(width, left, maxy, bytes(grid))
+
+    def pour(self, floor: bool = False) -> int:
+        grid = bytearray(self.grid)
+        width = self.width
+        abyss = self.maxy * width
+        bottom = (self.maxy + 1) * width
+
+        # The path of the falling grain. The next grain follows the same path until
+        # the cell where this one came to rest, so it resumes from the cell above.
+        path = [SOURCE[1] * width + SOURCE[0] - self.left]
+        count = 0
+        while path:
+            cell = path[-1]
+            if not floor and cell >= abyss:
+                break
+
+            if cell < bottom:
+                below = cell + width
+                if grid[below] == AIR:
+                    path.append(below)
+                    continue
+                if grid[below - 1] == AIR:
+                    path.append(below - 1)
+                    continue
+                if grid[below + 1] == AIR:
+                    path.append(below + 1)
+                    continue
+
+            grid[cell] = SOLID
+            path.pop()
+            count += 1
+
+        return count
+
+
+def parse_path(line: str) -> list[tuple[int, int]]:
+    path: list[tuple[int, int]] = []
+    for word in line.split(" -> "):
+        x, y = word.split(",")
+        path.append((int(x), int(y)))
+
+    return path
+
+
+def parse(data: str) -> Cave:
+    return Cave.from_paths([parse_path(line) for line in data.splitlines()])
+
+
+def part_one(cave: Cave) -> int:
+    return cave.pour()
+
+
+def part_two(cave: Cave) -> int:
+    return cave.pour(floor=True)
 
-    count = 0
-    while slice.add_sand(start, floor=True):
-        count += 1
 
-    print(f"Part two: {count}")
+def solve() -> None:
+    show(run("14"))
@@ -4,7 +4,7 @@ import re
 
 from attrs import Factory, define, frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 
 @frozen
@@ -51,11 +51,7 @@ class RangeUnion:
         return sum(r.size() for r in self.ranges)
 
 
-def solve() -> None:
-    input = data_dir() / "day15.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
+def parse(data: str) -> list[tuple[Cell, Cell]]:
     facts: list[tuple[Cell, Cell]] = []
     for line in data.splitlines():
         [sx, sy, bx, by] = re.findall(r"(-?\d+)", line)
@@ -63,6 +59,10 @@ def solve() -> None:
         beacon = Cell(int(bx), int(by))
         facts.append((sensor, beacon))
 
+    return facts
+
+
+def part_one(facts: list[tuple[Cell, Cell]]) -> int:
     visible = RangeUnion()
     row = 2000000
     for sensor, beacon in facts:
@@ -84,8 +84,10 @@ def solve() -> None:
 
         visible.add(Range(lo, hi + 1))
 
-    print(f"Part one: {visible.size()}")
+    return visible.size()
+
 
+def part_two(facts: list[tuple[Cell, Cell]]) -> int:
     sensors = [(sensor, sensor.manhattan(beacon)) for sensor, beacon in facts]
     stack = [(Cell(0, 0), Cell(4000000, 4000000))]
     while stack:
@@ -102,8 +104,7 @@ def solve() -> None:
             continue
 
         if nw == se:
-            print(f"Part two: {4000000 * nw.x + nw.y}")
-            break
+            return 4000000 * nw.x + nw.y
 
         midx = (nw.x + se.x) // 2
         midy = (nw.y + se.y) // 2
@@ -114,3 +115,9 @@ def solve() -> None:
             stack.append((Cell(nw.x, midy + 1), Cell(midx, se.y)))
         if midx < se.x and midy < se.y:
             stack.append((Cell(midx + 1, midy + 1), se))
+
+    raise AssertionError("No distress beacon found")
+
+
+def solve() -> None:
+    show(run("15"))
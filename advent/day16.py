@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, ClassVar
 
 from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -187,16 +187,18 @@ class Puzzle:
         return best_release
 
 
-def solve() -> None:
-    input = data_dir() / "day16.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
+def parse(data: str) -> Puzzle:
     valves = [Valve.from_line(line) for line in data.splitlines()]
-    puzzle = Puzzle.from_valves(valves)
+    return Puzzle.from_valves(valves)
+
+
+def part_one(puzzle: Puzzle) -> int:
+    return puzzle.solve(30)
 
-    best_release = puzzle.solve(30)
-    print(f"Part one: {best_release}")
 
-    best_release = puzzle.solve(26, num_cursors=2)
-    print(f"Part two: {best_release}")
+def part_two(puzzle: Puzzle) -> int:
+    return puzzle.solve(26, num_cursors=2)
+
+
+def solve() -> None:
+    show(run("16"))
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from attrs import define, frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -123,11 +123,11 @@ class Grid:
         return hash(frozenset(self.occupied.cells))
 
 
-def solve() -> None:
-    input = data_dir() / "day17.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read().strip()
+def parse(data: str) -> str:
+    return data.strip()
+
 
+def part_one(data: str) -> int:
     jets = itertools.cycle(data)
     grid = Grid()
     for count, shape in enumerate(itertools.cycle(SHAPES), 1):
@@ -135,8 +135,10 @@ def solve() -> None:
         if count == 2022:
             break
 
-    print(f"Part one: {grid.scrolled}")
+    return grid.scrolled
 
+
+def part_two(data: str) -> int:
     jets = itertools.cycle(data)
     markers: dict[tuple[int, int, int], tuple[int, int]] = {}
     heights: dict[int, int] = {}
@@ -165,5 +167,10 @@ def solve() -> None:
                 base += cycle_length
                 cycles -= 1
 
-            print(f"Part two: {heights[base] + cycles * cycle_height}")
-            break
+            return heights[base] + cycles * cycle_height
+
+    raise AssertionError("No cycle found")
+
+
+def solve() -> None:
+    show(run("17"))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections import deque
 from typing import TYPE_CHECKING, TypeAlias
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -33,17 +33,15 @@ def surface_area(cubes: Iterable[Cube]) -> int:
     return faces
 
 
-def solve() -> None:
-    input = data_dir() / "day18.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse(data: str) -> set[Cube]:
+    return {cube_from_line(line) for line in data.splitlines()}
 
-    lava = {cube_from_line(line) for line in data.splitlines()}
 
-    area = surface_area(lava)
+def part_one(lava: set[Cube]) -> int:
+    return surface_area(lava)
 
-    print(f"Part one: {area}")
 
+def part_two(lava: set[Cube]) -> int:
     # Fill a cube surrounding the lava.
     minx = min(x for x, y, z in lava) - 1
     maxx = max(x for x, y, z in lava) + 1
@@ -84,4 +82,8 @@ def solve() -> None:
     zlen = maxz - minz + 1
     cube_area = 2 * ((xlen * ylen) + (ylen * zlen) + (zlen * xlen))
 
-    print(f"Part two: {steam_area - cube_area}")
+    return steam_area - cube_area
+
+
+def solve() -> None:
+    show(run("18"))
@@ -4,7 +4,7 @@ import re
 
 from attrs import define, evolve, field, frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 
 @frozen
@@ -205,23 +205,27 @@ class Blueprint:
         return best_production
 
 
-def solve() -> None:
-    input = data_dir() / "day19.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse(data: str) -> list[Blueprint]:
+    return [Blueprint.from_line(line) for line in data.splitlines()]
 
-    blueprints = [Blueprint.from_line(line) for line in data.splitlines()]
 
+def part_one(blueprints: list[Blueprint]) -> int:
     total = 0
     for index, blueprint in enumerate(blueprints, 1):
         geodes = blueprint.geode_production(24)
         total += index * geodes
 
-    print(f"Part one: {total}")
+    return total
+
 
+def part_two(blueprints: list[Blueprint]) -> int:
     total = 1
     for blueprint in blueprints[:3]:
         geodes = blueprint.geode_production(32)
         total *= geodes
 
-    print(f"Part two: {total}")
+    return total
+
+
+def solve() -> None:
+    show(run("19"))
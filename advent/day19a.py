@@ -5,9 +5,8 @@ from __future__ import annotations
 import re
 
 from attrs import frozen
-from ortools.linear_solver import pywraplp
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 ORE = 0
 CLAY = 1
@@ -32,6 +31,9 @@ class Blueprint:
         return Blueprint(costs)
 
     def geode_production(self, max_time: int) -> int:
+        # ortools is slow to import, so only pay for it when it's needed.
+        from ortools.linear_solver import pywraplp
+
         solver = pywraplp.Solver.CreateSolver("BOP")
 
         # Do we build robot i at time t?
@@ -92,26 +94,30 @@ class Blueprint:
         return int(geodes)
 
 
-def solve() -> None:
-    input = data_dir() / "day19.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse(data: str) -> list[Blueprint]:
+    return [Blueprint.from_line(line) for line in data.splitlines()]
 
-    blueprints = [Blueprint.from_line(line) for line in data.splitlines()]
 
+def part_one(blueprints: list[Blueprint]) -> int:
     total = 0
     for index, blueprint in enumerate(blueprints, 1):
         geodes = blueprint.geode_production(24)
         total += index * geodes
 
-    print(f"Part one: {total}")
+    return total
+
 
+def part_two(blueprints: list[Blueprint]) -> int:
     total = 1
     for blueprint in blueprints[:3]:
         geodes = blueprint.geode_production(32)
         total *= geodes
 
-    print(f"Part two: {total}")
+    return total
+
+
+def solve() -> None:
+    show(run("19a"))
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -43,17 +43,19 @@ def extract_sum(input: Sequence[int]) -> int:
     return total
 
 
-def solve() -> None:
-    input = data_dir() / "day20.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse(data: str) -> list[int]:
+    return [int(line) for line in data.splitlines()]
 
-    numbers = [int(line) for line in data.splitlines()]
 
+def part_one(numbers: list[int]) -> int:
     output = mix(numbers)
-    answer = extract_sum(output)
-    print(f"Part one: {answer}")
+    return extract_sum(output)
+
 
+def part_two(numbers: list[int]) -> int:
     output = mix2(numbers)
-    answer = extract_sum(output)
-    print(f"Part two: {answer}")
+    return extract_sum(output)
+
+
+def solve() -> None:
+    show(run("20"))
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from attrs import frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -79,23 +79,34 @@ def topological_sort(monkeys: dict[str, Monkey]) -> list[str]:
     return order
 
 
-def solve() -> None:
-    input = data_dir() / "day21.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def evaluate_all(monkeys: dict[str, Monkey], order: list[str]) -> dict[str, int]:
+    evaluations: dict[str, int] = {}
+    for name in order:
+        monkey = monkeys[name]
+        evaluations[name] = monkey.evaluate(evaluations)
 
+    return evaluations
+
+
+def parse(data: str) -> dict[str, Monkey]:
     monkeys: dict[str, Monkey] = {}
     for line in data.splitlines():
         monkey = Monkey.from_line(line)
         monkeys[monkey.name] = monkey
 
+    return monkeys
+
+
+def part_one(monkeys: dict[str, Monkey]) -> int:
     order = topological_sort(monkeys)
-    evaluations: dict[str, int] = {}
-    for name in order:
-        monkey = monkeys[name]
-        evaluations[name] = monkey.evaluate(evaluations)
+    evaluations = evaluate_all(monkeys, order)
+    return evaluations["root"]
 
-    print(f"Part one: {evaluations['root']}")
+
+def part_two(monkeys: dict[str, Monkey]) -> int:
+    monkeys = dict(monkeys)
+    order = topological_sort(monkeys)
+    evaluations = evaluate_all(monkeys, order)
 
     root = monkeys["root"]
     assert root.expression is not None
@@ -116,12 +127,16 @@ def solve() -> None:
         value = evaluations[left]
 
         if value < target:
-            hi = mid + 1
+            hi = mid - 1
         elif value > target:
-            lo = mid - 1
+            lo = mid + 1
         else:
             answer = mid
             break
 
     assert answer is not None
-    print(f"Part two: {answer}")
+    return answer
+
+
+def solve() -> None:
+    show(run("21"))
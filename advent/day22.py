@@ -3,10 +3,11 @@ from typing import TypeAlias
 
 from attrs import Factory, define, field
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 Coord: TypeAlias = tuple[int, int]
 Direction: TypeAlias = tuple[int, int]
+Notes: TypeAlias = tuple[dict[Coord, str], list[str]]
 
 UP = (-1, 0)
 DOWN = (1, 0)
@@ -108,10 +109,6 @@ class Puzzle:
 
         self.position = (1, self._row_min[1])
 
-    def reset(self) -> None:
-        self.position = (1, self._row_min[1])
-        self.facing = RIGHT
-
     def wrap_part_one(self, position: Coord) -> Coord:
         row, column = position
         if self.facing == DOWN and row > self._col_max[column]:
@@ -164,11 +161,7 @@ class Puzzle:
         return password
 
 
-def solve() -> None:
-    input = data_dir() / "day22.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
-
+def parse(data: str) -> Notes:
     cells: dict[Coord, str] = {}
     indexed_lines = enumerate(data.splitlines(), 1)
     for row, line in indexed_lines:
@@ -179,20 +172,28 @@ def solve() -> None:
             if char != " ":
                 cells[row, column] = char
 
-    puzzle = Puzzle(cells)
-
     _, path = next(indexed_lines)
     instructions = re.split(r"(\D+)", path)
 
-    for instruction in instructions:
-        puzzle.act(instruction)
+    return cells, instructions
 
-    answer = puzzle.get_password()
-    print(f"Part one: {answer}")
 
-    puzzle.reset()
+def follow_path(notes: Notes, part_two: bool) -> int:
+    cells, instructions = notes
+    puzzle = Puzzle(cells)
     for instruction in instructions:
-        puzzle.act(instruction, part_two=True)
+        puzzle.act(instruction, part_two=part_two)
 
-    answer = puzzle.get_password()
-    print(f"Part two: {answer}")
+    return puzzle.get_password()
+
+
+def part_one(notes: Notes) -> int:
+    return follow_path(notes, part_two=False)
+
+
+def part_two(notes: Notes) -> int:
+    return follow_path(notes, part_two=True)
+
+
+def solve() -> None:
+    show(run("22"))
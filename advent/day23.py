@@ -5,7 +5,7 @@ from typing import TypeAlias
 
 from attrs import define
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 Coord: TypeAlias = tuple[int, int]
 Direction: TypeAlias = tuple[int, int]
@@ -92,24 +92,32 @@ class Map:
         return score
 
 
-def solve() -> None:
-    input = data_dir() / "day23.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse(data: str) -> Map:
+    return Map.from_text(data)
+
 
-    puzzle = Map.from_text(data)
+def part_one(start: Map) -> int:
+    puzzle = Map(set(start.elves))
     directions = [NORTH, SOUTH, WEST, EAST]
 
     for _ in range(10):
         puzzle.step(directions)
         directions = directions[1:] + directions[:1]
 
-    answer = puzzle.score()
-    print(f"Part one: {answer}")
+    return puzzle.score()
+
+
+def part_two(start: Map) -> int:
+    puzzle = Map(set(start.elves))
+    directions = [NORTH, SOUTH, WEST, EAST]
 
-    round = 11
+    round = 1
     while puzzle.step(directions):
         round += 1
         directions = directions[1:] + directions[:1]
 
-    print(f"Part two: {round}")
+    return round
+
+
+def solve() -> None:
+    show(run("23"))
@@ -3,9 +3,9 @@ from __future__ import annotations
 from collections import deque
 from typing import TypeAlias
 
-from attrs import Factory, define, frozen
+from attrs import Factory, define, evolve, frozen
 
-from advent.utils import data_dir
+from advent.runner import run, show
 
 Coord: TypeAlias = tuple[int, int]
 
@@ -114,23 +114,32 @@ class Map:
         raise AssertionError("No path found")
 
 
-def solve() -> None:
-    input = data_dir() / "day24.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse(data: str) -> Map:
+    return Map.from_text(data)
+
 
-    puzzle = Map.from_text(data)
+def part_one(puzzle: Map) -> int:
+    # A fresh memo of blizzards, so that the parsed map is left as it was.
+    puzzle = evolve(puzzle, occupied_cache={})
     start = (-1, 0)
     end = (puzzle.rows, puzzle.cols - 1)
     state = State(start, 0)
-    arrival = puzzle.earliest_arrival(end, state)
+    return puzzle.earliest_arrival(end, state)
 
-    print(f"Part one: {arrival}")
+
+def part_two(puzzle: Map) -> int:
+    puzzle = evolve(puzzle, occupied_cache={})
+    start = (-1, 0)
+    end = (puzzle.rows, puzzle.cols - 1)
+    state = State(start, 0)
+    arrival = puzzle.earliest_arrival(end, state)
 
     state = State(end, arrival)
     arrival = puzzle.earliest_arrival(start, state)
 
     state = State(start, arrival)
-    arrival = puzzle.earliest_arrival(end, state)
+    return puzzle.earliest_arrival(end, state)
 
-    print(f"Part two: {arrival}")
+
+def solve() -> None:
+    show(run("24"))
@@ -1,4 +1,11 @@
-from advent.utils import data_dir
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from advent.runner import run, show
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 def from_snafu(snafu: str) -> int:
@@ -40,13 +47,19 @@ def to_snafu(value: int) -> str:
     return "".join(chars)
 
 
-def solve() -> None:
-    input = data_dir() / "day25.txt"
-    with open(input, encoding="utf-8") as f:
-        data = f.read()
+def parse(data: str) -> list[int]:
+    return [from_snafu(line) for line in data.splitlines()]
+
 
-    values = [from_snafu(line) for line in data.splitlines()]
+def part_one(values: list[int]) -> str:
     total = sum(values)
-    answer = to_snafu(total)
+    return to_snafu(total)
 
-    print(f"Part one: {answer}")
+
+def solve_lines(lines: Iterable[str]) -> tuple[str]:
+    total = sum(from_snafu(line) for line in lines)
+    return (to_snafu(total),)
+
+
+def solve() -> None:
+    show(run("25"))
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import mmap
+import sys
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeAlias
+
+from advent.utils import data_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Solvers that can work on raw bytes are handed one of these, rather than a string.
+Buffer: TypeAlias = bytes | mmap.mmap
+
+
+class InputSource(ABC):
+    @staticmethod
+    def from_spec(spec: str | None) -> InputSource:
+        if spec is None:
+            return Directory(data_dir())
+
+        if spec == "-":
+            return Stdin()
+
+        path = Path(spec)
+        if path.is_dir():
+            return Directory(path)
+
+        return File(path)
+
+    @property
+    def single_day(self) -> bool:
+        return False
+
+    @abstractmethod
+    def path(self, day: str) -> Path | None:
+        ...
+
+    @contextmanager
+    def open(self, day: str) -> Iterator[Buffer]:
+        path = self.path(day)
+        assert path is not None
+        with open(path, "rb") as f:
+            # Empty files can't be mapped.
+            if path.stat().st_size == 0:
+                yield b""
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    def read(self, day: str) -> str:
+        with self.open(day) as buffer:
+            return str(buffer, "utf-8")
+
+
+class Directory(InputSource):
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def path(self, day: str) -> Path:
+        # Variant solutions such as 19a share the input for their day.
+        return self.directory / f"day{day[:2]}.txt"
+
+
+class File(InputSource):
+    def __init__(self, file: Path) -> None:
+        self.file = file
+
+    @property
+    def single_day(self) -> bool:
+        return True
+
+    def path(self, day: str) -> Path:
+        return self.file
+
+
+class Stdin(InputSource):
+    def __init__(self) -> None:
+        self.data: bytes | None = None
+
+    @property
+    def single_day(self) -> bool:
+        return True
+
+    def path(self, day: str) -> None:
+        return None
+
+    @contextmanager
+    def open(self, day: str) -> Iterator[Buffer]:
+        if self.data is None:
+            self.data = sys.stdin.buffer.read()
+
+        yield self.data
+
+
+def lines(buffer: Buffer) -> Iterator[str]:
+    # One line at a time rather than all at once, for "\n" or "\r\n" line endings.
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = len(buffer)
+
+        line = buffer[start:end]
+        yield str(line[:-1] if line.endswith(b"\r") else line, "utf-8")
+        start = end + 1
@@ -1,13 +1,149 @@
 #!/usr/bin/env python3
 
-import importlib
+from __future__ import annotations
+
+import argparse
 import sys
+import time
+from typing import TYPE_CHECKING
+
+from advent.inputs import InputSource
+from advent.runner import parse_days, run, show
+
+if TYPE_CHECKING:
+    from advent.runner import Answer
+
+# Rough running times in seconds, so that the slowest days get started first.
+COSTS = {
+    "23": 11.0,
+    "19a": 10.0,
+    "24": 5.6,
+    "20": 4.1,
+    "16": 2.2,
+    "19": 1.4,
+    "17": 1.3,
+}
+
+# Milliseconds of import time allowed per day. The days using attrs import in about
+# 50 to 65ms, the rest in about 30ms.
+IMPORT_BUDGET = 75.0
+
+
+def run_day(
+    day: str, use_cache: bool, refresh: bool, source: InputSource, stream: bool
+) -> tuple[list[Answer], float]:
+    start = time.perf_counter()
+    answers = run(
+        day, use_cache=use_cache, refresh=refresh, source=source, stream=stream
+    )
+    return answers, time.perf_counter() - start
+
+
+def run_batch(
+    days: list[str],
+    use_cache: bool,
+    refresh: bool,
+    source: InputSource,
+    stream: bool,
+) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    heaviest_first = sorted(days, key=lambda day: COSTS.get(day, 0.0), reverse=True)
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            day: executor.submit(run_day, day, use_cache, refresh, source, stream)
+            for day in heaviest_first
+        }
+
+        timings: dict[str, float] = {}
+        cached: set[str] = set()
+        for day in days:
+            answers, elapsed = futures[day].result()
+            timings[day] = elapsed
+            if all(answer.cached for answer in answers):
+                cached.add(day)
+            print(f"Day {day}:")
+            show(answers)
+
+    total = time.perf_counter() - start
+    print()
+    for day, elapsed in timings.items():
+        note = " (cached)" if day in cached else ""
+        print(f"Day {day:>3}: {elapsed:8.3f}s{note}")
+    print(f"Total:   {sum(timings.values()):8.3f}s")
+    print(f"Elapsed: {total:8.3f}s")
 
 
 def main() -> None:
-    day = int(sys.argv[1])
-    module = importlib.import_module(f"advent.day{day:02}")
-    module.solve()
+    # Heavier machinery is imported only when it's used, to keep startup quick.
+    if sys.argv[1:2] == ["bench"]:
+        from advent import bench
+
+        sys.exit(bench.main(sys.argv[2:]))
+
+    if sys.argv[1:2] == ["generate"]:
+        from advent import generate
+
+        sys.exit(generate.main(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(prog="advent")
+    parser.add_argument("days", help="eg 5, 1-10,16,19a or all")
+    parser.add_argument(
+        "--input",
+        help="input file, directory of inputs, or - for stdin (default: packaged data)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="solve line by line in constant memory, for days that support it",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="neither read nor write any caches"
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="recompute and overwrite cached results"
+    )
+    parser.add_argument(
+        "--import-profile",
+        action="store_true",
+        help="report the import time of each day instead of solving it",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=IMPORT_BUDGET,
+        help="milliseconds of import time allowed by --import-profile",
+    )
+    args = parser.parse_args()
+    use_cache = not args.no_cache
+
+    try:
+        days = parse_days(args.days)
+    except ValueError as e:
+        parser.error(str(e))
+
+    source = InputSource.from_spec(args.input)
+    if source.single_day and len(days) > 1:
+        parser.error("--input FILE or - can only be used with a single day")
+
+    if args.import_profile:
+        from advent import startup
+
+        sys.exit(startup.profile(days, args.budget))
+
+    if len(days) == 1:
+        answers = run(
+            days[0],
+            use_cache=use_cache,
+            refresh=args.refresh,
+            source=source,
+            stream=args.stream,
+        )
+        show(answers)
+        return
+
+    run_batch(days, use_cache, args.refresh, source, args.stream)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import importlib
+import re
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from advent.inputs import InputSource, lines
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+    from types import ModuleType
+
+    from advent.inputs import Buffer
+
+DAYS = [f"{day:02}" for day in range(1, 26)]
+DAYS.insert(DAYS.index("19") + 1, "19a")
+
+PART_NAMES = {1: "one", 2: "two"}
+
+
+# Not an attrs class: days that don't use attrs shouldn't pay to import it.
+class Answer(NamedTuple):
+    day: str
+    part: int
+    answer: int | str
+    # Seconds spent in this part, not counting reading and parsing the input.
+    elapsed: float
+    cached: bool = False
+
+    def __str__(self) -> str:
+        text = str(self.answer)
+        separator = "\n" if "\n" in text else " "
+        return f"Part {PART_NAMES[self.part]}:{separator}{text}"
+
+
+def parse_day(word: str) -> str:
+    m = re.fullmatch(r"(\d+)(a?)", word)
+    if m is None:
+        raise ValueError(f"Bad day: {word}")
+
+    day = f"{int(m.group(1)):02}{m.group(2)}"
+    if day not in DAYS:
+        raise ValueError(f"Bad day: {word}")
+
+    return day
+
+
+def parse_days(spec: str) -> list[str]:
+    if spec == "all":
+        return DAYS[:]
+
+    days: list[str] = []
+    for word in spec.split(","):
+        if "-" not in word:
+            days.append(parse_day(word))
+            continue
+
+        first, last = (DAYS.index(parse_day(end)) for end in word.split("-"))
+        if first > last:
+            raise ValueError(f"Bad range: {word}")
+
+        days += DAYS[first : last + 1]
+
+    # Drop any repeats, preserving order.
+    return list(dict.fromkeys(days))
+
+
+def load(day: str) -> ModuleType:
+    return importlib.import_module(f"advent.day{day}")
+
+
+def read_input(day: str) -> str:
+    return InputSource.from_spec(None).read(day)
+
+
+def get_solvers(module: ModuleType) -> dict[int, Callable[[Any], Any]]:
+    solvers = {1: module.part_one}
+    part_two = getattr(module, "part_two", None)
+    if part_two is not None:
+        solvers[2] = part_two
+
+    return solvers
+
+
+def parse(
+    day: str,
+    module: ModuleType,
+    buffer: Buffer,
+    path: Path | None,
+    input_hash: str | None,
+    refresh: bool,
+) -> Any:
+    # Days that can work directly on the raw buffer avoid decoding it at all.
+    parse_buffer = getattr(module, "parse_buffer", None)
+    if parse_buffer is not None:
+        return parse_buffer(buffer)
+
+    # Only inputs read from a file are cached, as those are the ones read again.
+    if input_hash is not None and path is not None:
+        from advent.cache import parse_cached
+
+        return parse_cached(day, module, path, buffer, input_hash, refresh=refresh)
+
+    return module.parse(str(buffer, "utf-8"))
+
+
+def solve_all(
+    day: str,
+    module: ModuleType,
+    buffer: Buffer,
+    path: Path | None,
+    input_hash: str | None,
+    refresh: bool,
+    stream: bool,
+) -> list[Answer]:
+    solve_lines = getattr(module, "solve_lines", None)
+    if stream and solve_lines is not None:
+        start = time.perf_counter()
+        results = solve_lines(lines(buffer))
+        elapsed = time.perf_counter() - start
+
+        # Both parts come out of the same pass, so they share its timing.
+        return [
+            Answer(day, part, answer, elapsed) for part, answer in enumerate(results, 1)
+        ]
+
+    puzzle = parse(day, module, buffer, path, input_hash, refresh)
+    return [
+        solve_part(day, part, solver, puzzle)
+        for part, solver in get_solvers(module).items()
+    ]
+
+
+def run(
+    day: str,
+    use_cache: bool = True,
+    refresh: bool = False,
+    source: InputSource | None = None,
+    stream: bool = False,
+) -> list[Answer]:
+    if source is None:
+        source = InputSource.from_spec(None)
+
+    module = load(day)
+    solvers = get_solvers(module)
+
+    with source.open(day) as buffer:
+        if not use_cache:
+            return solve_all(day, module, buffer, None, None, refresh, stream)
+
+        # Hashing and pickling are imported only when used, to keep startup quick.
+        from advent.cache import load_answer, save_answer, sha256, source_hash
+
+        start = time.perf_counter()
+        input_hash = sha256(buffer)
+        code = source_hash(module)
+        if not refresh:
+            found = [load_answer(day, part, input_hash, code) for part in solvers]
+            if all(answer is not None for answer in found):
+                elapsed = time.perf_counter() - start
+                return [
+                    Answer(day, part, answer, elapsed, cached=True)
+                    for part, answer in zip(solvers, found)
+                    if answer is not None
+                ]
+
+        path = source.path(day)
+        answers = solve_all(day, module, buffer, path, input_hash, refresh, stream)
+        for answer in answers:
+            save_answer(day, answer.part, input_hash, code, answer.answer)
+
+    return answers
+
+
+def solve_part(
+    day: str, part: int, solver: Callable[[Any], Any], puzzle: Any
+) -> Answer:
+    start = time.perf_counter()
+    answer = solver(puzzle)
+    elapsed = time.perf_counter() - start
+    return Answer(day, part, answer, elapsed)
+
+
+def show(answers: Iterable[Answer]) -> None:
+    for answer in answers:
+        print(answer)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import heapq
+from abc import ABC, abstractmethod
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+UNREACHABLE = -1
+
+
+class Graph(ABC):
+    # Nodes are numbered from zero, so that per-node data can live in flat arrays.
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        ...
+
+    @abstractmethod
+    def successors(self, node: int) -> Iterable[int]:
+        ...
+
+    @abstractmethod
+    def predecessors(self, node: int) -> Iterable[int]:
+        ...
+
+
+class Route(NamedTuple):
+    length: int
+    # Every node from start to goal inclusive, when asked for.
+    path: list[int] | None
+    # How many nodes the search expanded on the way.
+    expanded: int
+
+
+def walk_back(parents: dict[int, int], node: int) -> list[int]:
+    # Parents lead back to a node that is its own parent.
+    nodes = [node]
+    while parents[node] != node:
+        node = parents[node]
+        nodes.append(node)
+
+    return nodes
+
+
+def distance_field(graph: Graph, goal: int) -> array[int]:
+    # The number of steps from every node to the goal, by breadth-first search
+    # backwards from it.
+    field = array("i", [UNREACHABLE]) * graph.size
+    field[goal] = 0
+    queue = [goal]
+    for node in queue:
+        distance = field[node] + 1
+        for previous in graph.predecessors(node):
+            if field[previous] == UNREACHABLE:
+                field[previous] = distance
+                queue.append(previous)
+
+    return field
+
+
+def astar(
+    graph: Graph,
+    start: int,
+    goal: int,
+    heuristic: Callable[[int], int],
+    with_path: bool = False,
+) -> Route | None:
+    # The heuristic must never overestimate, nor drop by more than one per step:
+    # then each node is expanded once, at its final cost.
+    costs = {start: 0}
+    parents = {start: start}
+    frontier = [(heuristic(start), 0, start)]
+    expanded = 0
+    while frontier:
+        _, cost, node = heapq.heappop(frontier)
+        if cost > costs[node]:
+            continue
+
+        expanded += 1
+        if node == goal:
+            path = walk_back(parents, goal)[::-1] if with_path else None
+            return Route(cost, path, expanded)
+
+        cost += 1
+        for neighbour in graph.successors(node):
+            if neighbour not in costs or cost < costs[neighbour]:
+                costs[neighbour] = cost
+                parents[neighbour] = node
+                heapq.heappush(frontier, (cost + heuristic(neighbour), cost, neighbour))
+
+    return None
+
+
+def bidirectional_bfs(
+    graph: Graph, start: int, goal: int, with_path: bool = False
+) -> Route | None:
+    # Search forwards from the start and backwards from the goal, a whole level at a
+    # time and always growing the smaller frontier, until the two searches meet.
+    if start == goal:
+        return Route(0, [start] if with_path else None, 1)
+
+    forward = {start: start}
+    backward = {goal: goal}
+    depths = [{start: 0}, {goal: 0}]
+    frontiers = [[start], [goal]]
+    expanded = 0
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parents, other = (forward, backward) if side == 0 else (backward, forward)
+        steps = graph.successors if side == 0 else graph.predecessors
+        depth = depths[side][frontiers[side][0]] + 1
+
+        # The first level to touch the other search holds the shortest route, but
+        # not necessarily through the first meeting found in it.
+        best: tuple[int, int] | None = None
+        level: list[int] = []
+        for node in frontiers[side]:
+            expanded += 1
+            for neighbour in steps(node):
+                if neighbour in parents:
+                    continue
+
+                parents[neighbour] = node
+                depths[side][neighbour] = depth
+                level.append(neighbour)
+                if neighbour in other:
+                    length = depth + depths[1 - side][neighbour]
+                    if best is None or length < best[0]:
+                        best = length, neighbour
+
+        if best is not None:
+            length, meeting = best
+            path = None
+            if with_path:
+                path = (
+                    walk_back(forward, meeting)[::-1] + walk_back(backward, meeting)[1:]
+                )
+            return Route(length, path, expanded)
+
+        frontiers[side] = level
+
+    return None
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from collections import Counter
+
+# How many of the most expensive packages to report for each day.
+SHOW_PACKAGES = 5
+
+# Import times are noisy, so each day is measured this many times and the fastest
+# run kept.
+REPEATS = 3
+
+
+def import_times(day: str) -> Counter[str]:
+    # Run in a fresh interpreter, so that nothing has been imported already.
+    code = f"import advent.main, advent.day{day}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # Lines look like "import time: <self us> | <cumulative us> | <module>".
+    times: Counter[str] = Counter()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, _, module = line.removeprefix("import time:").split("|")
+        if not self_time.strip().isdigit():
+            continue
+
+        package = module.strip().split(".")[0]
+        times[package] += int(self_time)
+
+    return times
+
+
+def profile(days: list[str], budget: float) -> int:
+    over_budget = False
+    for day in days:
+        times = min(
+            (import_times(day) for _ in range(REPEATS)),
+            key=lambda times: sum(times.values()),
+        )
+        total = sum(times.values()) / 1000
+        verdict = "ok" if total <= budget else "OVER BUDGET"
+        over_budget |= total > budget
+
+        heaviest = ", ".join(
+            f"{package} {us / 1000:.1f}"
+            for package, us in times.most_common(SHOW_PACKAGES)
+        )
+        print(f"Day {day:>3}: {total:6.1f}ms {verdict:<11} ({heaviest})")
+
+    return 1 if over_budget else 0